@@ -1,742 +1,1545 @@
-#!/usr/bin/env python3
-
-"""
-AI Player Engine - Intelligent Move Selection for Tic Tac Toe
-
-This module implements the AI logic for the Tic Tac Toe game, 
-adapting its strategy according to the selected difficulty level. 
-
-It integrates advanced algorithms such as Minimax with alpha-beta pruning, 
-strategic heuristics, and time-limited evaluation for optimal move selection.
-
-Main features:
-
-    - Multiple AI difficulty levels from Easy to Very Hard
-    - Strategic evaluation with heuristic scoring functions
-    - Minimax algorithm with alpha-beta pruning and depth/time constraints
-    - Centralized AI configuration via AIConfig for flexibility
-    - Move scoring considering board symmetry and positional advantages
-    - Caching system (transposition table) to speed up recursive tree traversal
-
-Compatible with Linux environments and other POSIX-compliant systems.
-
-Author: Andrés David Aguilar Aguilar  
-Date: 2025-07-15
-"""
-
-from random import choice, random
-import time
-from typing import List, Union, Literal, Tuple, TYPE_CHECKING, Union
-
-if TYPE_CHECKING:
-    from helper_classes import Move
-
-from tic_tac_toe.core.enums import Difficulty
-from tic_tac_toe.core.helper_classes import AIConfig
-from tic_tac_toe.core.helper_methods import (
-    is_winning_combo,
-    board_to_str,
-    score_combo,
-    str_to_board
-)
-
-from tic_tac_toe.core.literals import *
-
-
-class AIPlayer:
-    """
-    AIPlayer evaluates the current board state and selects moves 
-    based on the configured difficulty level using strategies 
-    ranging from random to advanced Minimax with heuristics.
-
-    Attributes:
-        _current_moves (List[List[Move]]): Logical state of the board,
-            each cell contains a Move object with detailed info.
-        _mapping_moves (List[List[str]]): Visual representation of the board,
-            a matrix of symbols like 'X', 'O', or '_' to evaluate/display.
-        _size_board (int): The size of the board (e.g., 3 or 4).
-        _winning_combos (List[List[Tuple[int, int]]]): Winning cell sequences.
-        _level (Difficulty): AI difficulty level.
-        cache (dict[str, int]): Cache for storing evaluated board states.
-    """
-
-    # ───────────────────────────────────────────────
-    # 1. Initialization and Configuration
-    # ───────────────────────────────────────────────
-
-    def __init__(
-        self,
-        size_board: int,
-        current_moves: List[List['Move']],
-        mapping_moves: List[List[str]],
-        winning_combos: List[List[Tuple[int, int]]],
-        level: Difficulty = Difficulty.EASY
-    ) -> None:
-        """
-        Initialize the AIPlayer with the board configuration and difficulty.
-
-        Args:
-            size_board (int): Size of the board (e.g., 3 or 4).
-            current_moves (List[List[Move]]): Logical board state, each cell is a Move object.
-            mapping_moves (List[List[str]]): Visual board state with symbols ('X', 'O', '_').
-            winning_combos (List[List[Tuple[int, int]]]): List of winning combinations.
-            level (Difficulty): AI difficulty level (default is EASY).
-        """
-        if not isinstance(level, Difficulty):
-            raise ValueError("level must be a Difficulty instance.")
-        
-        self._size_board = size_board
-        self._current_moves = current_moves  # Logical state: Move objects with detailed info
-        self._mapping_moves = mapping_moves  # Visual state: symbols for evaluation/display
-        self._winning_combos = winning_combos
-        self._level = level
-        self.cache: dict[str, int] = {}
-
-
-    def set_current_state(
-        self,
-        size_board: int,
-        current_moves: List[List['Move']],
-        mapping_moves: List[List[str]],
-        winning_combos: List[List[Tuple[int, int]]]
-    ) -> None:
-        """
-        Update the AI's internal state (used when the board resets or changes).
-
-        Args:
-            size_board (int): Updated board size.
-            current_moves (List[List[Move]]): Updated logical state of the board.
-            mapping_moves (List[List[str]]): Updated visual state of the board.
-            winning_combos (List[List[Tuple[int, int]]]): Updated winning combinations.
-        """
-        self._size_board = size_board
-        self._current_moves = current_moves
-        self._mapping_moves = mapping_moves
-        self._winning_combos = winning_combos
-        self.cache.clear()
-
-
-    @property
-    def level(self) -> Difficulty:
-        """
-        Returns the current difficulty level of the AI.
-
-        Returns:
-            Difficulty: The current difficulty enum value.
-        """
-        return self._level
-
-
-    @level.setter
-    def level(self, value: Difficulty) -> None:
-        """
-        Sets a new difficulty level for the AI and clears the cache.
-
-        Args:
-            value (Difficulty): New difficulty to set.
-
-        Raises:
-            ValueError: If value is not an instance of Difficulty.
-        """
-        if not isinstance(value, Difficulty):
-            raise ValueError("level must be a Difficulty instance.")
-        self._level = value
-        self.cache.clear()
-
-
-    # ───────────────────────────────────────────────
-    # 2. Random AI Logic (EASY level) 😄
-    # ───────────────────────────────────────────────
-
-    def select_random_move(self) -> Tuple[int, int]:
-        """
-        Selects a random available cell from the board.
-
-        Returns:
-            Tuple[int, int]: Coordinates (row, col) of the selected move.
-
-        Raises:
-            RuntimeError: If no empty cells are available for the AI to move.
-        """
-        empty_cells: List[Tuple[int, int]] = self._get_remaining_moves(all_moves=True)
-        if not empty_cells:
-            raise RuntimeError("AI attempted to play, but no empty cells were available.")
-        return choice(empty_cells)
-
-
-    # ───────────────────────────────────────────────
-    # 3. Minimax AI Logic 🤔😨🤖
-    # ───────────────────────────────────────────────
-
-    # ── 3A. Medium Level
-
-    def select_medium_move(self) -> Tuple[int, int]:
-        """
-        Selects the next move using basic Minimax (no pruning),
-        with a 20% chance to make a random mistake to simulate imperfection.
-
-        Returns:
-            Tuple[int, int]: Coordinates (row, col) of the selected move.
-
-        Raises:
-            RuntimeError: If no empty cells are available.
-        """
-        empty_cells: List[Tuple[int, int]] = self._get_remaining_moves(all_moves=True)
-        if not empty_cells:
-            raise RuntimeError("AI attempted to move but no valid cells are available.")
-
-        # In early 4x4 openings, skip Minimax to reduce computation
-        if self._should_skip_minimax_opening(empty_cells):
-            return self.select_random_move()
-
-        if self._introduce_random_error(chance=AIConfig.get(self._level, "error")):
-            return self.select_random_move()
-
-        return self._evaluate_all_moves_minimax(
-            candidates=empty_cells,
-            depth=AIConfig.get(self._level, "depth")
-        )
-
-
-    def _introduce_random_error(self, chance: Union[float, None]) -> bool:
-        """
-        Randomly decides whether to simulate a mistake based on probability.
-
-        Args:
-            chance (float | None): Probability between 0 and 1, or None for never.
-
-        Returns:
-            bool: True if an error should be simulated.
-        """
-        return False if chance is None else random() < chance
-
-
-    def _should_skip_minimax_opening(self, empty_cells: List[Tuple[int, int]]) -> bool:
-        """
-        Avoids Minimax in early stages of 4x4 games (performance safeguard).
-
-        Args:
-            empty_cells (List[Tuple[int, int]]): All current available cells.
-
-        Returns:
-            bool: True if early move should be random.
-        """
-        return self._size_board == 4 and len(empty_cells) > self._size_board ** 2 - 4
-    
-
-    def min_max_medium(
-        self,
-        depth: int,
-        turn_max: bool,
-        max_depth: int = 3
-    ) -> int:
-        """
-        Basic Minimax algorithm for MEDIUM level.
-        No alpha-beta pruning, no heuristics, fixed depth.
-
-        Args:
-            depth (int): Current depth in the tree.
-            turn_max (bool): Whether it's the AI's turn.
-            max_depth (int): Maximum recursion depth.
-
-        Returns:
-            int: Evaluation score of the board state.
-
-        Raises:
-            TypeError: If depth or max_depth is not integer or turn_max is not boolean.
-        """
-
-        if not isinstance(depth, int) or not isinstance(max_depth, int) or not isinstance(turn_max, bool):
-            raise TypeError("depth and max_depth must be int, turn_max must be bool")
-
-        score = self.evaluate_ai_score()
-        if score in (10, -10):
-            return score - depth if turn_max else score + depth
-
-        if not self._get_remaining_moves(mapping=True) or depth >= max_depth:
-            return 0
-
-        best = float('-inf') if turn_max else float('inf')
-
-        for row in range(self._size_board):
-            for col in range(self._size_board):
-                if self._mapping_moves[row][col] != UNDERSCORE:
-                    continue
-
-                self._mapping_moves[row][col] = AI_MARK if turn_max else PLAYER_MARK
-                eval = self.min_max_medium(depth + 1, not turn_max, max_depth)
-                self._mapping_moves[row][col] = UNDERSCORE
-
-                best = max(best, eval) if turn_max else min(best, eval)
-
-        return best
-    
-
-    def _evaluate_all_moves_minimax(
-        self,
-        candidates: List[Tuple[int, int]],
-        depth: int
-    ) -> Tuple[int, int]:
-        """
-        Evaluates all valid moves using basic Minimax and selects the best.
-
-        Args:
-            candidates (List[Tuple[int, int]]): Available cells.
-            depth (int): Maximum depth to evaluate.
-
-        Returns:
-            Tuple[int, int]: Best move found using Minimax.
-        """
-        best_score = float('-inf')
-        best_moves: List[Tuple[int, int]] = []
-
-        for r, c in candidates:
-            self._mapping_moves[r][c] = AI_MARK
-            score = self.min_max_medium(0, turn_max=False, max_depth=depth)
-            self._mapping_moves[r][c] = UNDERSCORE
-
-            if score > best_score:
-                best_score = score
-                best_moves = [(r, c)]
-            elif score == best_score:
-                best_moves.append((r, c))
-
-        return choice(best_moves)
-    
-
-    # ── 3B. Hard Level
-
-    def select_hard_move(self) -> Tuple[int, int]:
-        """
-        Selects the optimal move using Minimax with alpha-beta pruning.
-
-        Returns:
-            Tuple[int, int]: Coordinates (row, col) of the best move.
-
-        Raises:
-            RuntimeError: If no valid cells are available.
-        """
-        best_value = float('-inf')
-        best_moves: List[Tuple[int, int]] = []
-        candidates = self._get_remaining_moves(all_moves=True)
-
-        if not candidates:
-            raise RuntimeError("AI attempted to move but no valid cells are available.")
-
-        for row, col in candidates:
-            self._mapping_moves[row][col] = AI_MARK
-            value = self.min_max_hard(
-                depth=0,
-                turn_max=False,
-                alpha=float('-inf'),
-                beta=float('inf')
-            )
-            self._mapping_moves[row][col] = UNDERSCORE
-
-            if value > best_value:
-                best_value = value
-                best_moves = [(row, col)]
-            elif value == best_value:
-                best_moves.append((row, col))
-
-        # Fallback in case no optimal move found (should not happen, safety net)
-        return choice(best_moves) if best_moves else self.select_random_move()
-
-
-    def min_max_hard(
-        self,
-        depth: int,
-        turn_max: bool,
-        alpha: float,
-        beta: float
-    ) -> int:
-        """
-        Wrapper for HARD-level Minimax with alpha-beta pruning.
-
-        Args:
-            depth (int): Current recursion depth.
-            turn_max (bool): Whether it's the AI's turn.
-            alpha (float): Alpha cutoff value.
-            beta (float): Beta cutoff value.
-
-        Returns:
-            int: Evaluation score for the current state.
-
-        Raises:
-            TypeError: If inputs are not of expected types.
-        """
-
-        if not isinstance(depth, int) or not isinstance(turn_max, bool):
-            raise TypeError("depth must be int and turn_max must be bool")
-        if not isinstance(alpha, (float, int)) or not isinstance(beta, (float, int)):
-            raise TypeError("alpha and beta must be float or int")
-            
-        return self._minimax_core(
-            depth=depth,
-            turn_max=turn_max,
-            alpha=alpha,
-            beta=beta,
-            max_depth=AIConfig.get(Difficulty.HARD, "depth"),
-            use_time_limit=False
-        )
-
-
-    # ── 3C. Very Hard Level
-
-    def select_very_hard_move(self) -> Tuple[int, int]:
-        """
-        Selects the best move using full Minimax with pruning, 
-        time limit, heuristic boosts, and strategic tie-breaking.
-
-        Returns:
-            Tuple[int, int]: Coordinates (row, col) of the chosen move.
-        """
-        self._start_time = time.perf_counter()
-        self._time_limit = AIConfig.get(Difficulty.VERY_HARD, "time_limit")
-
-        best_value = float('-inf')
-        best_coords: Tuple[int, int] = (-1, -1)
-        candidates: List[Tuple[int, int]] = self._get_remaining_moves(all_moves=True)
-        registry: dict[str, Tuple[int, int, int]] = {}
-
-        for row, col in candidates:
-            self._mapping_moves[row][col] = AI_MARK
-            
-            value = self.min_max_very_hard(0, turn_max=False, alpha=float('-inf'), beta=float('inf'))
-
-            if value >= best_value:
-                best_value = value
-                registry[board_to_str(self._mapping_moves)] = (value, row, col)
-
-            self._mapping_moves[row][col] = UNDERSCORE
-
-        # Filter all top moves with best value
-        top_moves = [
-            (board_str, val, row, col)
-            for board_str, (val, row, col) in registry.items()
-            if val == best_value
-        ]
-
-        if len(top_moves) == 1:
-            _, _, row, col = top_moves[0]
-            return (row, col)
-
-        # Use heuristic scoring to break ties
-        best_score = float('-inf')
-        for board_str, _, row, col in top_moves:
-            board = str_to_board(board_str, self._size_board)
-            score = self.evaluate_ai_score(boost=True, map=board)
-            if score > best_score:
-                best_score = score
-                best_coords = (row, col)
-
-        return best_coords
-
-
-    def min_max_very_hard(
-        self,
-        depth: int,
-        turn_max: bool,
-        alpha: float,
-        beta: float
-    ) -> int:
-        """
-        Performs Minimax with alpha-beta pruning and a time constraint.
-
-        Args:
-            depth (int): Current search depth.
-            turn_max (bool): Whether it's AI's turn.
-            alpha (float): Alpha cutoff.
-            beta (float): Beta cutoff.
-
-        Returns:
-            int: Score from evaluation function.
-
-        Raises:
-            TypeError: If inputs are not of expected types.
-        """
-
-        if not isinstance(depth, int) or not isinstance(turn_max, bool):
-            raise TypeError("depth must be int and turn_max must be bool")
-        if not isinstance(alpha, (float, int)) or not isinstance(beta, (float, int)):
-            raise TypeError("alpha and beta must be float or int")
-
-        return self._minimax_core(
-            depth=depth,
-            turn_max=turn_max,
-            alpha=alpha,
-            beta=beta,
-            max_depth=None,
-            use_time_limit=True
-        )
-
-
-    # ───────────────────────────────────────────────
-    # 4. Scoring and Heuristics 🎯📈
-    # ───────────────────────────────────────────────
-
-    def evaluate_ai_score(self, boost: bool = False, map: Union[List[List[str]], None] = None) -> int:
-        """
-        Evaluates the current board and returns a numeric score.
-
-        Args:
-            boost (bool): Whether to apply strategic heuristics.
-            map (list[list[str]] | None): Optional board override.
-
-        Returns:
-            int: Heuristic score.
-        """
-        if map is not None and not isinstance(map, list):
-            raise TypeError("Expected map to be a list of lists or None")
-
-        base_score = self._calculate_base_score(map=map)
-        return self._apply_boost(base_score, map=map) if boost else base_score
-
-
-    def _calculate_base_score(self, map: Union[List[List[str]], None] = None) -> int:
-        """
-        Calculates the base score without strategic boosts.
-
-        Args:
-            map (list[list[str]] | None): Optional board.
-
-        Returns:
-            int: +10 if AI wins, -10 if player wins, or cumulative neutral score.
-        """
-        map = map or self._mapping_moves
-
-        total_score = 0
-        for combo in self._winning_combos:
-            values = [map[r][c] for r, c in combo]
-            score = score_combo(
-                values, combo, boost=False,
-                size_board=self._size_board,
-                board=self._mapping_moves
-            )
-            if score in (10, -10):
-                return score  # Immediate win/loss
-            total_score += score
-
-        return total_score
-
-
-    def _apply_boost(self, base_score: int, map: Union[List[List[str]], None] = None) -> int:
-        """
-        Applies strategic heuristics to boost base score.
-
-        Args:
-            base_score (int): Original score.
-            map (list[list[str]] | None): Board for evaluation.
-
-        Returns:
-            int: Boosted score.
-        """
-        map = map or self._mapping_moves
-        boost_scores: List[float] = []
-
-        for combo in self._winning_combos:
-            values = [map[r][c] for r, c in combo]
-            if not is_winning_combo(values):
-                score = score_combo(
-                    values, combo, boost=True,
-                    size_board=self._size_board,
-                    board=self._mapping_moves
-                )
-                boost_scores.append(score)
-
-        if not boost_scores:
-            return base_score
-
-        max_boost = max(boost_scores)
-        other_boosts = sum(s for s in boost_scores if s != max_boost)
-        final_boost = max_boost + 0.2 * other_boosts
-
-        return int(round(base_score + final_boost))
-
-
-    # ───────────────────────────────────────────────
-    # 5. Minimax Engine Core ♟️
-    # ───────────────────────────────────────────────
-
-    def _is_time_exceeded(self) -> bool:
-        """
-        Checks whether the AI has exceeded its allowed computation time.
-
-        Returns:
-            bool: True if the elapsed time since start exceeds the AI's time limit.
-        """
-        return (time.perf_counter() - self._start_time) > self._time_limit
-
-
-    def _get_cache_key(self) -> str:
-        """
-        Generates a unique string key for the current board state to use in the cache.
-
-        Returns:
-            str: Flattened string representation of the current visual board.
-        """
-        return board_to_str(self._mapping_moves)
-
-
-    def _evaluate_terminal_state(self, depth: int) -> Union[int, None]:
-        """
-        Evaluates whether the current board state is terminal (win, loss, or draw).
-
-        Args:
-            depth (int): Current depth in the Minimax recursion.
-
-        Returns:
-            int | None: Returns the heuristic score if terminal, otherwise None.
-        """
-        score = self.evaluate_ai_score()
-        if abs(score) == 10:  # Win or loss detected
-            return score - depth if score > 0 else score + depth
-
-        # No moves left means a draw
-        if not self._get_remaining_moves(all_moves=True, mapping=True):
-            return 0
-
-        return None
-
-
-    def _minimax_core(
-        self,
-        depth: int,
-        turn_max: bool,
-        alpha: float,
-        beta: float,
-        max_depth: Union[int, None],
-        use_time_limit: bool = False
-    ) -> int:
-        """
-        Core Minimax algorithm with alpha-beta pruning and optional time limit.
-
-        Args:
-            depth (int): Current recursion depth.
-            turn_max (bool): Whether the AI is maximizing (True) or minimizing (False).
-            alpha (float): Best value that the maximizer currently can guarantee.
-            beta (float): Best value that the minimizer currently can guarantee.
-            max_depth (int | None): Maximum allowed recursion depth (None for unlimited).
-            use_time_limit (bool): If True, terminates early if time limit exceeded.
-
-        Returns:
-            int: Heuristic score representing the desirability of the current board state.
-        """
-
-        # Check if the AI has exceeded its computation time limit
-        if use_time_limit and self._is_time_exceeded():
-            return self.evaluate_ai_score()
-
-        # Check recursion depth limit
-        if max_depth is not None and depth >= max_depth:
-            return self.evaluate_ai_score()
-
-        # Generate cache key and check if result already computed
-        key = self._get_cache_key()
-        if key in self.cache:
-            return self.cache[key]
-
-        # Evaluate terminal conditions: win, loss, or draw
-        terminal_score = self._evaluate_terminal_state(depth)
-        if terminal_score is not None:
-            return terminal_score
-
-        # Get remaining moves, sorted by priority (center > corners > edges)
-        remaining_moves = self._get_remaining_moves(all_moves=True, mapping=True)
-
-        def move_priority(pos: Tuple[int, int]) -> int:
-            row, col = pos
-            center = self._size_board // 2
-            if (row, col) == (center, center):
-                return 3  # center is highest priority
-            elif (row in (0, self._size_board - 1) and col in (0, self._size_board - 1)):
-                return 2  # corners next
-            else:
-                return 1  # edges last
-
-        remaining_moves.sort(key=move_priority, reverse=True)
-
-        best = float('-inf') if turn_max else float('inf')
-
-        # Recursively explore moves
-        for row, col in remaining_moves:
-            self._mapping_moves[row][col] = AI_MARK if turn_max else PLAYER_MARK
-            val = self._minimax_core(
-                depth + 1,
-                not turn_max,
-                alpha,
-                beta,
-                max_depth,
-                use_time_limit
-            )
-            self._mapping_moves[row][col] = UNDERSCORE
-
-            if turn_max:
-                if val > best:
-                    best = val
-                if val > alpha:
-                    alpha = val
-            else:
-                if val < best:
-                    best = val
-                if val < beta:
-                    beta = val
-
-            # Alpha-beta pruning cutoff
-            if beta <= alpha:
-                break
-
-        self.cache[key] = best
-        return best
-
-
-    # ───────────────────────────────────────────────
-    # 6. Board Tools and Utilities 🧰
-    # ───────────────────────────────────────────────
-
-    def _get_remaining_moves(
-        self,
-        all_moves: bool = False,
-        mapping: bool = False
-    ) -> Union[List[Tuple[int, int]], Tuple[int, int], Literal[False]]:
-        """
-        Returns available positions on the board.
-
-        Args:
-            all_moves (bool): If True, returns a list of all available positions.
-                            If False, returns the first available position found.
-            mapping (bool): If True, uses the visual board (_mapping_moves);
-                            otherwise uses the logical board (_current_moves).
-
-        Returns:
-            List[Tuple[int, int]]: List of (row, col) coordinates if all_moves is True.
-            Tuple[int, int]: Single (row, col) coordinate if all_moves is False.
-            False: If the board is full (no available moves).
-
-        Raises:
-            TypeError: If 'all_moves' or 'mapping' are not booleans.
-        """
-        if not isinstance(all_moves, bool):
-            raise TypeError(f"'all_moves' must be bool, got {type(all_moves).__name__}")
-        if not isinstance(mapping, bool):
-            raise TypeError(f"'mapping' must be bool, got {type(mapping).__name__}")
-
-        # Choose the board: visual or logical.
-        board = (
-            self._mapping_moves if mapping
-            else [[move.animal for move in row] for row in self._current_moves]
-        )
-
-        available: List[Tuple[int, int]] = [
-            (r, c)
-            for r in range(self._size_board)
-            for c in range(self._size_board)
-            if board[r][c] == (UNDERSCORE if mapping else EMPTY)
-        ]
-
-        if all_moves:
-            return available
-        else:
-            return available[0] if available else False
-
-
+#!/usr/bin/env python3
+
+"""
+AI Player Engine - Intelligent Move Selection for Tic Tac Toe
+
+This module implements the AI logic for the Tic Tac Toe game, 
+adapting its strategy according to the selected difficulty level. 
+
+It integrates advanced algorithms such as Minimax with alpha-beta pruning, 
+strategic heuristics, and time-limited evaluation for optimal move selection.
+
+Main features:
+
+    - Multiple AI difficulty levels from Easy to Very Hard
+    - Strategic evaluation with heuristic scoring functions
+    - Minimax algorithm with alpha-beta pruning and depth/time constraints
+    - Centralized AI configuration via AIConfig for flexibility
+    - Move scoring considering board symmetry and positional advantages
+    - Caching system (transposition table) to speed up recursive tree traversal
+
+Compatible with Linux environments and other POSIX-compliant systems.
+
+Author: Andrés David Aguilar Aguilar  
+Date: 2025-07-15
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from random import choice, getrandbits, random
+import time
+from typing import List, Union, Literal, Tuple, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from helper_classes import Move
+
+from tic_tac_toe.core.enums import Difficulty
+from tic_tac_toe.core.helper_classes import AIConfig
+from tic_tac_toe.core.helper_methods import (
+    board_to_masks,
+    calculate_boost_score,
+    line_mask,
+    str_to_board
+)
+
+from tic_tac_toe.core.literals import *
+from tic_tac_toe.ai import minimax_kernel
+from tic_tac_toe.ai import scoring_kernel
+
+# Integer window sentinels: real scores stay within +/-10 +/- depth, so
+# int-only comparisons avoid CPython's mixed float/int numeric path.
+_NEG_INF = -10 ** 9
+_POS_INF = 10 ** 9
+
+
+def _evaluate_root_move_worker(
+    args: Tuple[str, int, List[List[Tuple[int, int]]], int, int]
+) -> Tuple[int, int, int]:
+    """
+    Evaluates one HARD-level root move in a worker process.
+
+    Root subtrees are independent alpha-beta searches, so they parallelize
+    across processes (threads would serialize on the GIL for this pure
+    compute). Each worker rebuilds a throwaway AIPlayer from the serialized
+    board and keeps its own local transposition table.
+
+    Args:
+        args: (board string, board size, winning combos, row, col) of the
+            position before the move and the root move to search.
+
+    Returns:
+        Tuple[int, int, int]: (value, row, col) for the searched move.
+    """
+    board_str, size, combos, row, col = args
+    mapping = str_to_board(board_str, size)
+    # The logical Move board is never touched on this path
+    ai = AIPlayer(size, [], mapping, combos, Difficulty.HARD)
+    ai._sync_board()
+    ai._board[row * size + col] = ai._AI
+    ai._count_move(row * size + col, ai._AI, 1)
+    ai._reset_hashes()
+    value = ai.min_max_hard(
+        depth=0, turn_max=False, alpha=_NEG_INF, beta=_POS_INF
+    )
+    return value, row, col
+
+
+class AIPlayer:
+    """
+    AIPlayer evaluates the current board state and selects moves 
+    based on the configured difficulty level using strategies 
+    ranging from random to advanced Minimax with heuristics.
+
+    Attributes:
+        _current_moves (List[List[Move]]): Logical state of the board,
+            each cell contains a Move object with detailed info.
+        _mapping_moves (List[List[str]]): Visual representation of the board,
+            a matrix of symbols like 'X', 'O', or '_' to evaluate/display.
+        _board (bytearray): Flat search board (0=empty, 1=AI, 2=player)
+            synced from the visual board at the root of each search.
+        _size_board (int): The size of the board (e.g., 3 or 4).
+        _winning_combos (List[List[Tuple[int, int]]]): Winning cell sequences.
+        _level (Difficulty): AI difficulty level.
+        cache (OrderedDict[int, tuple]): Bounded LRU transposition table
+            keyed by Zobrist hash; entries are (value, depth_searched,
+            flag, best_move) tuples.
+    """
+
+    # Cell codes of the flat search board (shared with minimax_kernel)
+    _EMPTY = 0
+    _AI = 1
+    _PLAYER = 2
+
+    # Translates flat cell codes back to the visual symbols
+    _SYMBOL_TABLE = bytes.maketrans(bytes([0, 1, 2]), (UNDERSCORE + AI_MARK + PLAYER_MARK).encode())
+
+    # Fixed attribute layout: the engine allocates one AIPlayer per worker
+    # and touches its attributes on every node, so slots replace the
+    # per-instance dict with direct offsets and shrink each instance.
+    __slots__ = (
+        '_size_board', '_current_moves', '_mapping_moves', '_winning_combos',
+        '_level', 'cache',
+        '_perms', '_inv_perms', '_sym_keys', '_hashes',
+        '_ordered_cells', '_flat_combos', '_cell_lines',
+        '_line_ai', '_line_pl', '_board', '_frames',
+        '_ai_depth', '_ai_error', '_ai_time_limit',
+        '_hard_depth', '_very_hard_time_limit', '_deadline_ns',
+    )
+
+    # Transposition-table bound flags
+    _TT_EXACT = 0
+    _TT_LOWER = 1
+    _TT_UPPER = 2
+
+    # Depth credited to entries from searches without a depth limit
+    _TT_MAX_DEPTH = 64
+
+    # Entry cap for the transposition table: once exceeded, the least
+    # recently touched entry is evicted so memory stays bounded
+    _TT_CAPACITY = 1 << 20
+
+    # Root parallelization: shared worker pool and the minimum number of
+    # root moves that justifies the process round-trip overhead
+    _pool: Union[ProcessPoolExecutor, None] = None
+    _PARALLEL_MIN_MOVES = 8
+
+    # Field layout of the preallocated search-stack frames
+    _F_DEPTH = 0        # node depth
+    _F_TURN = 1         # True when the AI is maximizing
+    _F_ALPHA = 2        # current alpha window bound
+    _F_BETA = 3         # current beta window bound
+    _F_ALPHA_ORIG = 4   # alpha at entry, for the TT bound flag
+    _F_BEST = 5         # best value found so far
+    _F_BEST_MOVE = 6    # flat cell of the best value
+    _F_CELLS = 7        # move ordering used at this node
+    _F_IDX = 8          # next index into _F_CELLS
+    _F_KEY = 9          # Zobrist key of this node
+    _F_LAST = 10        # flat cell of the move currently on the board
+    _F_MARK = 11        # cell code placed by this node's moves
+    _F_REMAIN = 12      # remaining depth credited to the TT entry
+    _F_SYM = 13         # index of the canonical symmetry at this node
+    _F_SIZE = 14
+
+    # ───────────────────────────────────────────────
+    # 1. Initialization and Configuration
+    # ───────────────────────────────────────────────
+
+    def __init__(
+        self,
+        size_board: int,
+        current_moves: List[List['Move']],
+        mapping_moves: List[List[str]],
+        winning_combos: List[List[Tuple[int, int]]],
+        level: Difficulty = Difficulty.EASY
+    ) -> None:
+        """
+        Initialize the AIPlayer with the board configuration and difficulty.
+
+        Args:
+            size_board (int): Size of the board (e.g., 3 or 4).
+            current_moves (List[List[Move]]): Logical board state, each cell is a Move object.
+            mapping_moves (List[List[str]]): Visual board state with symbols ('X', 'O', '_').
+            winning_combos (List[List[Tuple[int, int]]]): List of winning combinations.
+            level (Difficulty): AI difficulty level (default is EASY).
+        """
+        if not isinstance(level, Difficulty):
+            raise ValueError("level must be a Difficulty instance.")
+        
+        self._size_board = size_board
+        self._current_moves = current_moves  # Logical state: Move objects with detailed info
+        self._mapping_moves = mapping_moves  # Visual state: symbols for evaluation/display
+        self._winning_combos = winning_combos
+        self._level = level
+        self.cache: OrderedDict[int, tuple] = OrderedDict()
+        self._init_zobrist()
+        self._init_move_order()
+        self._refresh_level_config()
+
+
+    def _refresh_level_config(self) -> None:
+        """
+        Caches the AIConfig values of the current level on the instance.
+
+        The search paths read these on every entry, so the settings lookup
+        is paid once per level change instead of once per node.
+        """
+        settings = AIConfig.SETTINGS[self._level]
+        self._ai_depth = settings.depth
+        self._ai_error = settings.error
+        self._ai_time_limit = settings.time_limit
+        self._hard_depth = AIConfig.SETTINGS[Difficulty.HARD].depth
+        self._very_hard_time_limit = AIConfig.SETTINGS[Difficulty.VERY_HARD].time_limit
+
+
+    def set_current_state(
+        self,
+        size_board: int,
+        current_moves: List[List['Move']],
+        mapping_moves: List[List[str]],
+        winning_combos: List[List[Tuple[int, int]]]
+    ) -> None:
+        """
+        Update the AI's internal state (used when the board resets or changes).
+
+        Args:
+            size_board (int): Updated board size.
+            current_moves (List[List[Move]]): Updated logical state of the board.
+            mapping_moves (List[List[str]]): Updated visual state of the board.
+            winning_combos (List[List[Tuple[int, int]]]): Updated winning combinations.
+        """
+        self._size_board = size_board
+        self._current_moves = current_moves
+        self._mapping_moves = mapping_moves
+        self._winning_combos = winning_combos
+        self.cache.clear()
+        self._init_zobrist()
+        self._init_move_order()
+
+
+    def _init_zobrist(self) -> None:
+        """
+        Builds the Zobrist tables of random 64-bit keys, one per (cell, piece).
+
+        The board hash is the XOR of the keys of all occupied cells, so it can
+        be updated incrementally with a single XOR on each make/unmake step
+        instead of re-serializing the whole board per node.
+
+        Boards have a dihedral symmetry group of 8 (4 rotations x mirror),
+        and all 8 variants of a position share the same subtree value. One
+        hash per symmetry is therefore maintained in parallel — hash t of
+        this board equals the plain hash of the board transformed by
+        permutation t — and the smallest of the 8 serves as the canonical
+        transposition key, collapsing symmetric positions into one entry.
+        """
+        size = self._size_board
+        last = size - 1
+        cells = size * size
+
+        zobrist = [[0, getrandbits(64), getrandbits(64)] for _ in range(cells)]
+
+        # The 8 symmetry transforms as (row, col) -> (row', col') mappings
+        transforms = (
+            lambda r, c: (r, c),                # identity
+            lambda r, c: (c, last - r),         # rot90
+            lambda r, c: (last - r, last - c),  # rot180
+            lambda r, c: (last - c, r),         # rot270
+            lambda r, c: (r, last - c),         # horizontal mirror
+            lambda r, c: (last - r, c),         # vertical mirror
+            lambda r, c: (c, r),                # transpose
+            lambda r, c: (last - c, last - r),  # anti-transpose
+        )
+
+        self._perms: List[List[int]] = []
+        self._inv_perms: List[List[int]] = []
+        for transform in transforms:
+            perm = [0] * cells
+            inv = [0] * cells
+            for cell in range(cells):
+                r, c = divmod(cell, size)
+                tr, tc = transform(r, c)
+                perm[cell] = tr * size + tc
+                inv[tr * size + tc] = cell
+            self._perms.append(perm)
+            self._inv_perms.append(inv)
+
+        # Pre-permuted keys: _sym_keys[cell][code][t] is the key that cell
+        # contributes to symmetry-hash t, so make/unmake is 8 plain XORs.
+        self._sym_keys = [
+            [
+                tuple(zobrist[perm[cell]][code] for perm in self._perms)
+                for code in range(3)
+            ]
+            for cell in range(cells)
+        ]
+        self._hashes: List[int] = [0] * len(transforms)
+
+
+    def _hash_move(self, cell: int, code: int) -> None:
+        """
+        Folds placing (or removing) a piece into all symmetry hashes.
+
+        Args:
+            cell (int): Flat cell index of the move.
+            code (int): Cell code of the piece (XOR is its own inverse,
+                so the same call makes and unmakes).
+        """
+        keys = self._sym_keys[cell][code]
+        hashes = self._hashes
+        for t in range(8):
+            hashes[t] ^= keys[t]
+
+
+    def _reset_hashes(self) -> None:
+        """
+        Recomputes all symmetry hashes of the flat search board from scratch.
+
+        Called once at the root of each search after syncing the board;
+        inside the search the hashes are maintained incrementally.
+        """
+        hashes = [0] * 8
+        for cell, code in enumerate(self._board):
+            if code:
+                keys = self._sym_keys[cell][code]
+                for t in range(8):
+                    hashes[t] ^= keys[t]
+        self._hashes = hashes
+
+
+    def _init_move_order(self) -> None:
+        """
+        Precomputes the flat search board and per-layout lookup tables.
+
+        Builds the static search order of all cells (center > corners >
+        edges) so the search loop can skip occupied cells instead of
+        rebuilding and re-sorting a move list per node, plus the winning
+        combinations as flat cell-index lists for direct board reads.
+        """
+        size = self._size_board
+        center = size // 2
+        last = size - 1
+
+        def move_priority(cell: int) -> int:
+            row, col = divmod(cell, size)
+            if (row, col) == (center, center):
+                return 3  # center is highest priority
+            elif row in (0, last) and col in (0, last):
+                return 2  # corners next
+            else:
+                return 1  # edges last
+
+        self._ordered_cells: List[int] = sorted(
+            range(size * size), key=move_priority, reverse=True
+        )
+        self._flat_combos: List[Tuple[int, ...]] = [
+            tuple(r * size + c for r, c in combo) for combo in self._winning_combos
+        ]
+        # Lines through each cell: after a move only these can complete,
+        # so per-node win checks need not rescan the whole combo list.
+        self._cell_lines: List[Tuple[int, ...]] = [
+            tuple(i for i, combo in enumerate(self._flat_combos) if cell in combo)
+            for cell in range(size * size)
+        ]
+        # Marks per line and side, maintained incrementally on make/unmake:
+        # a line is won exactly when its counter reaches the board size.
+        self._line_ai: List[int] = [0] * len(self._flat_combos)
+        self._line_pl: List[int] = [0] * len(self._flat_combos)
+        self._board = bytearray(size * size)
+        # One reusable frame per possible ply, so the iterative search
+        # never allocates frame storage inside the hot loop.
+        self._frames: List[list] = [
+            [None] * self._F_SIZE for _ in range(size * size + 2)
+        ]
+
+
+    def _sync_board(self) -> None:
+        """
+        Rebuilds the flat search board from the shared visual board.
+
+        Called once at the root of each search; inside the recursion all
+        make/unmake steps mutate the bytearray directly, so cell reads and
+        compares are single-indirection integer operations instead of
+        nested list indexing plus string comparison.
+        """
+        size = self._size_board
+        board = self._board
+        for r in range(size):
+            row = self._mapping_moves[r]
+            base = r * size
+            for c in range(size):
+                cell = row[c]
+                if cell == AI_MARK:
+                    board[base + c] = self._AI
+                elif cell == PLAYER_MARK:
+                    board[base + c] = self._PLAYER
+                else:
+                    board[base + c] = self._EMPTY
+
+        line_ai = [0] * len(self._flat_combos)
+        line_pl = [0] * len(self._flat_combos)
+        for i, combo in enumerate(self._flat_combos):
+            for idx in combo:
+                code = board[idx]
+                if code == self._AI:
+                    line_ai[i] += 1
+                elif code == self._PLAYER:
+                    line_pl[i] += 1
+        self._line_ai = line_ai
+        self._line_pl = line_pl
+
+
+    def _board_to_symbol_str(self) -> str:
+        """
+        Serializes the flat search board back to the visual symbol string.
+
+        Returns:
+            str: Flattened board string using the X/O/_ symbols.
+        """
+        return bytes(self._board).translate(self._SYMBOL_TABLE).decode()
+
+
+    def _evaluate_board(self) -> int:
+        """
+        Win/loss scan of the flat search board via the per-line counters.
+
+        Returns:
+            int: +10 if the AI owns a full line, -10 if the player does,
+                0 otherwise.
+        """
+        size = self._size_board
+        if size in self._line_ai:
+            return 10
+        if size in self._line_pl:
+            return -10
+        return 0
+
+
+    def _evaluate_board_at(self, cell: int) -> int:
+        """
+        Win/loss check restricted to the lines through the last-played cell.
+
+        Every interior search node is reached right after a move, and a win
+        created by that move must run through it; comparing just those few
+        line counters replaces the full combo sweep in the hot path.
+
+        Args:
+            cell (int): Flat index of the move that produced this position.
+
+        Returns:
+            int: +10 / -10 if that move completed a line, 0 otherwise.
+        """
+        size = self._size_board
+        line_ai = self._line_ai
+        line_pl = self._line_pl
+        for line in self._cell_lines[cell]:
+            if line_ai[line] == size:
+                return 10
+            if line_pl[line] == size:
+                return -10
+        return 0
+
+
+    def _count_move(self, cell: int, mark: int, delta: int) -> None:
+        """
+        Adjusts the per-line mark counters for a move made or unmade.
+
+        Args:
+            cell (int): Flat cell index of the move.
+            mark (int): Cell code of the side that moved.
+            delta (int): +1 when making the move, -1 when unmaking it.
+        """
+        counts = self._line_ai if mark == self._AI else self._line_pl
+        for line in self._cell_lines[cell]:
+            counts[line] += delta
+
+
+    def _any_empty(self) -> bool:
+        """
+        Short-circuit scan for at least one empty cell on the search board.
+
+        Returns:
+            bool: True if any cell is still empty.
+        """
+        return self._EMPTY in self._board
+
+
+    @property
+    def level(self) -> Difficulty:
+        """
+        Returns the current difficulty level of the AI.
+
+        Returns:
+            Difficulty: The current difficulty enum value.
+        """
+        return self._level
+
+
+    @level.setter
+    def level(self, value: Difficulty) -> None:
+        """
+        Sets a new difficulty level for the AI and clears the cache.
+
+        Args:
+            value (Difficulty): New difficulty to set.
+
+        Raises:
+            ValueError: If value is not an instance of Difficulty.
+        """
+        if not isinstance(value, Difficulty):
+            raise ValueError("level must be a Difficulty instance.")
+        self._level = value
+        self.cache.clear()
+        self._refresh_level_config()
+
+
+    # ───────────────────────────────────────────────
+    # 2. Random AI Logic (EASY level) 😄
+    # ───────────────────────────────────────────────
+
+    def select_random_move(self) -> Tuple[int, int]:
+        """
+        Selects a random available cell from the board.
+
+        Returns:
+            Tuple[int, int]: Coordinates (row, col) of the selected move.
+
+        Raises:
+            RuntimeError: If no empty cells are available for the AI to move.
+        """
+        empty_cells: List[Tuple[int, int]] = self._get_remaining_moves(all_moves=True)
+        if not empty_cells:
+            raise RuntimeError("AI attempted to play, but no empty cells were available.")
+        return choice(empty_cells)
+
+
+    # ───────────────────────────────────────────────
+    # 3. Minimax AI Logic 🤔😨🤖
+    # ───────────────────────────────────────────────
+
+    # ── 3A. Medium Level
+
+    def select_medium_move(self) -> Tuple[int, int]:
+        """
+        Selects the next move using basic Minimax (no pruning),
+        with a 20% chance to make a random mistake to simulate imperfection.
+
+        Returns:
+            Tuple[int, int]: Coordinates (row, col) of the selected move.
+
+        Raises:
+            RuntimeError: If no empty cells are available.
+        """
+        empty_cells: List[Tuple[int, int]] = self._get_remaining_moves(all_moves=True)
+        if not empty_cells:
+            raise RuntimeError("AI attempted to move but no valid cells are available.")
+
+        # In early 4x4 openings, skip Minimax to reduce computation
+        if self._should_skip_minimax_opening(empty_cells):
+            return self.select_random_move()
+
+        if self._introduce_random_error(chance=self._ai_error):
+            return self.select_random_move()
+
+        return self._evaluate_all_moves_minimax(
+            candidates=empty_cells,
+            depth=self._ai_depth
+        )
+
+
+    def _introduce_random_error(self, chance: Union[float, None]) -> bool:
+        """
+        Randomly decides whether to simulate a mistake based on probability.
+
+        Args:
+            chance (float | None): Probability between 0 and 1, or None for never.
+
+        Returns:
+            bool: True if an error should be simulated.
+        """
+        return False if chance is None else random() < chance
+
+
+    def _should_skip_minimax_opening(self, empty_cells: List[Tuple[int, int]]) -> bool:
+        """
+        Avoids Minimax in early stages of 4x4 games (performance safeguard).
+
+        Args:
+            empty_cells (List[Tuple[int, int]]): All current available cells.
+
+        Returns:
+            bool: True if early move should be random.
+        """
+        return self._size_board == 4 and len(empty_cells) > self._size_board ** 2 - 4
+    
+
+    def min_max_medium(
+        self,
+        depth: int,
+        turn_max: bool,
+        max_depth: int = 3
+    ) -> int:
+        """
+        Basic Minimax algorithm for MEDIUM level.
+        No alpha-beta pruning, no heuristics, fixed depth.
+
+        Args:
+            depth (int): Current depth in the tree.
+            turn_max (bool): Whether it's the AI's turn.
+            max_depth (int): Maximum recursion depth.
+
+        Returns:
+            int: Evaluation score of the board state.
+        """
+
+        score = self._evaluate_board()
+        if score in (10, -10):
+            return score - depth if turn_max else score + depth
+
+        if not self._any_empty() or depth >= max_depth:
+            return 0
+
+        best = _NEG_INF if turn_max else _POS_INF
+        board = self._board
+        mark = self._AI if turn_max else self._PLAYER
+
+        for cell in range(self._size_board ** 2):
+            if board[cell] != self._EMPTY:
+                continue
+
+            board[cell] = mark
+            self._count_move(cell, mark, 1)
+            eval = self.min_max_medium(depth + 1, not turn_max, max_depth)
+            board[cell] = self._EMPTY
+            self._count_move(cell, mark, -1)
+
+            best = max(best, eval) if turn_max else min(best, eval)
+
+        return best
+    
+
+    def _evaluate_all_moves_minimax(
+        self,
+        candidates: List[Tuple[int, int]],
+        depth: int
+    ) -> Tuple[int, int]:
+        """
+        Evaluates all valid moves using basic Minimax and selects the best.
+
+        Args:
+            candidates (List[Tuple[int, int]]): Available cells.
+            depth (int): Maximum depth to evaluate.
+
+        Returns:
+            Tuple[int, int]: Best move found using Minimax.
+        """
+        best_score = _NEG_INF
+        best_moves: List[Tuple[int, int]] = []
+
+        self._sync_board()
+        board = self._board
+        size = self._size_board
+
+        for r, c in candidates:
+            cell = r * size + c
+            board[cell] = self._AI
+            self._count_move(cell, self._AI, 1)
+            score = self.min_max_medium(0, turn_max=False, max_depth=depth)
+            board[cell] = self._EMPTY
+            self._count_move(cell, self._AI, -1)
+
+            if score > best_score:
+                best_score = score
+                best_moves = [(r, c)]
+            elif score == best_score:
+                best_moves.append((r, c))
+
+        return choice(best_moves)
+    
+
+
+    def _find_immediate_move(self, candidates: List[Tuple[int, int]]) -> Union[Tuple[int, int], None]:
+        """
+        Resolves positions that need no search at all.
+
+        A lone remaining cell is forced, a cell that wins on the spot is
+        always optimal, and a cell where the opponent would win next turn
+        must be blocked. Each scan is one make/check/unmake per candidate,
+        so whole search trees are skipped in the late game.
+
+        Args:
+            candidates (List[Tuple[int, int]]): Available moves. The flat
+                board must already be synced.
+
+        Returns:
+            Tuple[int, int] | None: The forced move, or None if the
+            position genuinely requires a search.
+        """
+        if len(candidates) == 1:
+            return candidates[0]
+
+        board = self._board
+        size = self._size_board
+
+        for mark, result in ((self._AI, 10), (self._PLAYER, -10)):
+            for row, col in candidates:
+                cell = row * size + col
+                board[cell] = mark
+                self._count_move(cell, mark, 1)
+                score = self._evaluate_board_at(cell)
+                board[cell] = self._EMPTY
+                self._count_move(cell, mark, -1)
+                if score == result:
+                    return (row, col)
+
+        return None
+
+
+    # ── 3B. Hard Level
+
+    def select_hard_move(self) -> Tuple[int, int]:
+        """
+        Selects the optimal move using Minimax with alpha-beta pruning.
+
+        Returns:
+            Tuple[int, int]: Coordinates (row, col) of the best move.
+
+        Raises:
+            RuntimeError: If no valid cells are available.
+        """
+        best_value = _NEG_INF
+        best_moves: List[Tuple[int, int]] = []
+        candidates = self._get_remaining_moves(all_moves=True)
+
+        if not candidates:
+            raise RuntimeError("AI attempted to move but no valid cells are available.")
+
+        self._sync_board()
+        forced = self._find_immediate_move(candidates)
+        if forced is not None:
+            return forced
+
+        # Delegate the per-move search to the compiled kernel when available;
+        # otherwise fall back to the interpreted minimax core.
+        if minimax_kernel.NUMBA_AVAILABLE:
+            return self._select_hard_move_kernel(candidates)
+
+        # Interpreted search on a wide 4x4 root: farm the independent root
+        # subtrees out to worker processes (root parallelization).
+        if self._size_board >= 4 and len(candidates) >= self._PARALLEL_MIN_MOVES:
+            return self._select_hard_move_parallel(candidates)
+
+        self._sync_board()
+        self._reset_hashes()
+        board = self._board
+        size = self._size_board
+
+        for row, col in candidates:
+            cell = row * size + col
+            board[cell] = self._AI
+            self._count_move(cell, self._AI, 1)
+            self._hash_move(cell, self._AI)
+            value = self.min_max_hard(
+                depth=0,
+                turn_max=False,
+                alpha=_NEG_INF,
+                beta=_POS_INF
+            )
+            board[cell] = self._EMPTY
+            self._count_move(cell, self._AI, -1)
+            self._hash_move(cell, self._AI)
+
+            if value > best_value:
+                best_value = value
+                best_moves = [(row, col)]
+            elif value == best_value:
+                best_moves.append((row, col))
+
+        # Fallback in case no optimal move found (should not happen, safety net)
+        return choice(best_moves) if best_moves else self.select_random_move()
+
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        """
+        Returns the shared worker pool, creating it on first use.
+
+        The pool is cached on the class so repeated AI turns reuse the
+        already-spawned workers instead of paying process startup per move.
+
+        Returns:
+            ProcessPoolExecutor: The shared executor.
+        """
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor()
+        return cls._pool
+
+
+    def _select_hard_move_parallel(self, candidates: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Evaluates the HARD-level root moves across worker processes.
+
+        Each candidate's subtree is searched by _evaluate_root_move_worker
+        with its own local transposition table; results are reduced to the
+        usual best-value tie list.
+
+        Args:
+            candidates (List[Tuple[int, int]]): Available root moves.
+
+        Returns:
+            Tuple[int, int]: Coordinates (row, col) of the best move.
+        """
+        self._sync_board()
+        board_str = self._board_to_symbol_str()
+        tasks = [
+            (board_str, self._size_board, self._winning_combos, row, col)
+            for row, col in candidates
+        ]
+
+        best_value = _NEG_INF
+        best_moves: List[Tuple[int, int]] = []
+
+        for value, row, col in self._get_pool().map(_evaluate_root_move_worker, tasks):
+            if value > best_value:
+                best_value = value
+                best_moves = [(row, col)]
+            elif value == best_value:
+                best_moves.append((row, col))
+
+        return choice(best_moves) if best_moves else self.select_random_move()
+
+
+    def _select_hard_move_kernel(self, candidates: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Evaluates the HARD-level root moves via the Numba-compiled kernel.
+
+        The board is marshalled once into a flat int8 array; each candidate
+        is made/unmade directly on the array and scored by the compiled
+        alpha-beta search, which returns the same values as the Python core.
+
+        Args:
+            candidates (List[Tuple[int, int]]): Available root moves.
+
+        Returns:
+            Tuple[int, int]: Coordinates (row, col) of the best move.
+        """
+        np = minimax_kernel.np
+        size = self._size_board
+        board = minimax_kernel.encode_board(self._mapping_moves, size, AI_MARK, PLAYER_MARK)
+        combos = minimax_kernel.encode_combos(self._winning_combos, size)
+        order = np.array(minimax_kernel.move_order(size), dtype=np.int32)
+        max_depth = self._hard_depth
+
+        best_value = -minimax_kernel.INF
+        best_moves: List[Tuple[int, int]] = []
+
+        for row, col in candidates:
+            cell = row * size + col
+            board[cell] = minimax_kernel.AI_CODE
+            value = minimax_kernel._minimax(
+                board, 0, False,
+                -minimax_kernel.INF, minimax_kernel.INF,
+                max_depth, combos, order
+            )
+            board[cell] = minimax_kernel.EMPTY_CODE
+
+            if value > best_value:
+                best_value = value
+                best_moves = [(row, col)]
+            elif value == best_value:
+                best_moves.append((row, col))
+
+        return choice(best_moves) if best_moves else self.select_random_move()
+
+
+    def min_max_hard(
+        self,
+        depth: int,
+        turn_max: bool,
+        alpha: int,
+        beta: int
+    ) -> int:
+        """
+        Wrapper for HARD-level Minimax with alpha-beta pruning.
+
+        Args:
+            depth (int): Current recursion depth.
+            turn_max (bool): Whether it's the AI's turn.
+            alpha (int): Alpha cutoff value.
+            beta (int): Beta cutoff value.
+
+        Returns:
+            int: Evaluation score for the current state.
+        """
+
+        return self._minimax_core(
+            depth=depth,
+            turn_max=turn_max,
+            alpha=alpha,
+            beta=beta,
+            max_depth=self._hard_depth,
+            use_time_limit=False
+        )
+
+
+    # ── 3C. Very Hard Level
+
+    def select_very_hard_move(self) -> Tuple[int, int]:
+        """
+        Selects the best move using full Minimax with pruning,
+        time limit, heuristic boosts, and strategic tie-breaking.
+
+        The search runs with iterative deepening: each pass seeds the next
+        one with its best move (tried first at the root) and with the
+        transposition-table orderings it populated, so the deepest pass that
+        fits in the time budget converges quickly. Results of a pass that
+        ran out of time are discarded in favour of the last completed one.
+
+        Returns:
+            Tuple[int, int]: Coordinates (row, col) of the chosen move.
+        """
+        self._deadline_ns = time.monotonic_ns() + int(self._very_hard_time_limit * 1e9)
+
+        candidates: List[Tuple[int, int]] = self._get_remaining_moves(all_moves=True)
+
+        self._sync_board()
+        forced = self._find_immediate_move(candidates)
+        if forced is not None:
+            return forced
+
+        self._reset_hashes()
+
+        best_value = _NEG_INF
+        best_coords: Tuple[int, int] = (-1, -1)
+        registry: dict[Tuple[int, int], int] = {}
+        pv_move: Union[Tuple[int, int], None] = None
+
+        # Deepen one ply at a time until the budget runs out; the deepest
+        # board cannot be searched past the number of empty cells.
+        for max_depth in range(1, len(candidates) + 1):
+            completed, value, iter_registry = self._search_root_moves(
+                candidates, max_depth, pv_move
+            )
+            if not completed:
+                break
+
+            best_value = value
+            registry = iter_registry
+            pv_move = max(iter_registry, key=iter_registry.get)
+
+        # Filter all top moves with best value
+        top_moves = [move for move, val in registry.items() if val == best_value]
+
+        if not top_moves:
+            # Not even the first pass finished in time: fall back to the
+            # static ordering's first free cell.
+            return candidates[0]
+
+        if len(top_moves) == 1:
+            return top_moves[0]
+
+        # Use heuristic scoring to break ties: replay each tied move on the
+        # visual board in place instead of round-tripping through strings.
+        best_score = _NEG_INF
+        mapping = self._mapping_moves
+        for row, col in top_moves:
+            mapping[row][col] = AI_MARK
+            score = self.evaluate_ai_score(boost=True)
+            mapping[row][col] = UNDERSCORE
+            if score > best_score:
+                best_score = score
+                best_coords = (row, col)
+
+        return best_coords
+
+
+    def _search_root_moves(
+        self,
+        candidates: List[Tuple[int, int]],
+        max_depth: int,
+        pv_move: Union[Tuple[int, int], None]
+    ) -> Tuple[bool, int, dict]:
+        """
+        Runs one fixed-depth, time-limited pass over the root moves.
+
+        Args:
+            candidates (List[Tuple[int, int]]): Available root moves.
+            max_depth (int): Depth limit of this deepening iteration.
+            pv_move (Tuple[int, int] | None): Best move of the previous
+                iteration, searched first to maximize early cutoffs.
+
+        Returns:
+            Tuple[bool, int, dict]: (completed, best value, registry of
+            (row, col) -> value for the moves that matched the running
+            best). completed is False if time ran out before every root
+            move was fully searched.
+        """
+        board = self._board
+        size = self._size_board
+
+        ordered = candidates
+        if pv_move is not None and pv_move in candidates and pv_move != candidates[0]:
+            ordered = [pv_move] + [move for move in candidates if move != pv_move]
+
+        best_value = _NEG_INF
+        registry: dict[Tuple[int, int], int] = {}
+
+        for row, col in ordered:
+            cell = row * size + col
+            board[cell] = self._AI
+            self._count_move(cell, self._AI, 1)
+            self._hash_move(cell, self._AI)
+
+            value = self._minimax_core(
+                depth=0,
+                turn_max=False,
+                alpha=_NEG_INF,
+                beta=_POS_INF,
+                max_depth=max_depth,
+                use_time_limit=True,
+                last_cell=cell
+            )
+
+            if value >= best_value:
+                best_value = value
+                registry[(row, col)] = value
+
+            board[cell] = self._EMPTY
+            self._count_move(cell, self._AI, -1)
+            self._hash_move(cell, self._AI)
+
+            # A timed-out pass returned a truncated value somewhere below:
+            # report the iteration as incomplete so it gets discarded.
+            if self._is_time_exceeded():
+                return False, best_value, registry
+
+        return True, best_value, registry
+
+
+    def min_max_very_hard(
+        self,
+        depth: int,
+        turn_max: bool,
+        alpha: int,
+        beta: int
+    ) -> int:
+        """
+        Performs Minimax with alpha-beta pruning and a time constraint.
+
+        Args:
+            depth (int): Current search depth.
+            turn_max (bool): Whether it's AI's turn.
+            alpha (int): Alpha cutoff.
+            beta (int): Beta cutoff.
+
+        Returns:
+            int: Score from evaluation function.
+        """
+
+        return self._minimax_core(
+            depth=depth,
+            turn_max=turn_max,
+            alpha=alpha,
+            beta=beta,
+            max_depth=None,
+            use_time_limit=True
+        )
+
+
+    # ───────────────────────────────────────────────
+    # 4. Scoring and Heuristics 🎯📈
+    # ───────────────────────────────────────────────
+
+    def evaluate_ai_score(self, boost: bool = False, map: Union[List[List[str]], None] = None) -> int:
+        """
+        Evaluates the current board and returns a numeric score.
+
+        Args:
+            boost (bool): Whether to apply strategic heuristics.
+            map (list[list[str]] | None): Optional board override.
+
+        Returns:
+            int: Heuristic score.
+        """
+        if map is not None and not isinstance(map, list):
+            raise TypeError("Expected map to be a list of lists or None")
+
+        base_score = self._calculate_base_score(map=map)
+        return self._apply_boost(base_score, map=map) if boost else base_score
+
+
+    def _calculate_base_score(self, map: Union[List[List[str]], None] = None) -> int:
+        """
+        Calculates the base score without strategic boosts.
+
+        Runs a direct counter pass per winning line instead of building a
+        values list and delegating to score_combo: without boosts every
+        undecided line scores 0, so only full lines matter.
+
+        Args:
+            map (list[list[str]] | None): Optional board.
+
+        Returns:
+            int: +10 if AI wins, -10 if player wins, 0 otherwise.
+        """
+        map = map or self._mapping_moves
+
+        line_len = self._size_board
+        for combo in self._winning_combos:
+            ai = player = 0
+            for r, c in combo:
+                value = map[r][c]
+                if value == AI_MARK:
+                    ai += 1
+                elif value == PLAYER_MARK:
+                    player += 1
+            if ai == line_len:
+                return 10  # Immediate win
+            if player == line_len:
+                return -10  # Immediate loss
+
+        return 0
+
+
+    def _apply_boost(self, base_score: int, map: Union[List[List[str]], None] = None) -> int:
+        """
+        Applies strategic heuristics to boost base score.
+
+        Args:
+            base_score (int): Original score.
+            map (list[list[str]] | None): Board for evaluation.
+
+        Returns:
+            int: Boosted score.
+        """
+        map = map or self._mapping_moves
+        size = self._size_board
+
+        # Compiled path: with the Numba extras installed the whole
+        # per-line cascade runs as one machine-code pass over flat arrays.
+        if scoring_kernel.NUMBA_AVAILABLE:
+            skip_board = minimax_kernel.encode_board(map, size, AI_MARK, PLAYER_MARK)
+            score_board = (
+                skip_board if map is self._mapping_moves
+                else minimax_kernel.encode_board(
+                    self._mapping_moves, size, AI_MARK, PLAYER_MARK
+                )
+            )
+            combos, pos_table, sym_table = scoring_kernel.get_tables(
+                size, self._winning_combos
+            )
+            total, max_boost, max_count = scoring_kernel.boost_stats(
+                skip_board, score_board, combos, pos_table, sym_table
+            )
+            if max_count == 0:
+                return base_score
+            other_boosts = total - max_boost * max_count
+            return int(round(base_score + max_boost + 0.2 * other_boosts))
+
+        # Pack each board once: per-line counts and win checks then reduce
+        # to bitmask arithmetic inside the scoring helpers.
+        map_masks = board_to_masks(map, size)
+        board_masks = (
+            map_masks if map is self._mapping_moves
+            else board_to_masks(self._mapping_moves, size)
+        )
+        map_ai, map_pl = map_masks
+
+        # Stream the line scores instead of collecting them: the running
+        # total, the maximum and how often it occurs are enough to weight
+        # the dominant line fully and the rest at 0.2.
+        total = 0.0
+        max_boost = _NEG_INF
+        max_count = 0
+        scored_any = False
+
+        for combo in self._winning_combos:
+            lm = line_mask(tuple(combo), size)
+            if (map_ai & lm) == lm or (map_pl & lm) == lm:
+                continue
+
+            # Decided lines were skipped above, so the win branch of
+            # score_combo can never fire: score the line directly from
+            # the masks without rebuilding its symbol values.
+            score = int(calculate_boost_score(
+                combo, size, self._mapping_moves, masks=board_masks
+            ))
+            scored_any = True
+            total += score
+            if score > max_boost:
+                max_boost = score
+                max_count = 1
+            elif score == max_boost:
+                max_count += 1
+
+        if not scored_any:
+            return base_score
+
+        other_boosts = total - max_boost * max_count
+        final_boost = max_boost + 0.2 * other_boosts
+
+        return int(round(base_score + final_boost))
+
+
+    # ───────────────────────────────────────────────
+    # 5. Minimax Engine Core ♟️
+    # ───────────────────────────────────────────────
+
+    def _is_time_exceeded(self) -> bool:
+        """
+        Checks whether the AI has exceeded its allowed computation time.
+
+        The deadline is fixed once per move as an integer monotonic-clock
+        timestamp, so the check is a single nanosecond comparison with no
+        float arithmetic.
+
+        Returns:
+            bool: True if the deadline of the current move has passed.
+        """
+        return time.monotonic_ns() >= self._deadline_ns
+
+
+    def _get_cache_key(self) -> int:
+        """
+        Returns the transposition-table key for the current board state.
+
+        The key is the smallest of the incrementally maintained symmetry
+        hashes, so all 8 rotated/mirrored variants of a position share one
+        entry and the key is still O(1) to produce.
+
+        Returns:
+            int: Canonical 64-bit Zobrist hash of the current board.
+        """
+        return min(self._hashes)
+
+
+    def _evaluate_terminal_state(self, depth: int) -> Union[int, None]:
+        """
+        Evaluates whether the current board state is terminal (win, loss, or draw).
+
+        Args:
+            depth (int): Current depth in the Minimax recursion.
+
+        Returns:
+            int | None: Returns the heuristic score if terminal, otherwise None.
+        """
+        score = self._evaluate_board()
+        if score:  # Win or loss detected
+            return score - depth if score > 0 else score + depth
+
+        # No moves left means a draw
+        if not self._any_empty():
+            return 0
+
+        return None
+
+
+    def _minimax_core(
+        self,
+        depth: int,
+        turn_max: bool,
+        alpha: int,
+        beta: int,
+        max_depth: Union[int, None],
+        use_time_limit: bool = False,
+        last_cell: Union[int, None] = None
+    ) -> int:
+        """
+        Core Minimax algorithm with alpha-beta pruning and optional time limit.
+
+        Args:
+            depth (int): Current recursion depth.
+            turn_max (bool): Whether the AI is maximizing (True) or minimizing (False).
+            alpha (int): Best value that the maximizer currently can guarantee.
+            beta (int): Best value that the minimizer currently can guarantee.
+            max_depth (int | None): Maximum allowed recursion depth (None for unlimited).
+            use_time_limit (bool): If True, terminates early if time limit exceeded.
+            last_cell (int | None): Flat cell of the move that produced this
+                position, enabling the incremental win check at the root.
+
+        Returns:
+            int: Heuristic score representing the desirability of the current board state.
+
+        Note:
+            The tree is walked iteratively over the preallocated frame stack
+            rather than by recursion: per-node work is tiny here, so CPython
+            frame setup/teardown was a large share of the search cost.
+        """
+
+        board = self._board
+        cache = self.cache
+        frames = self._frames
+        empty = self._EMPTY
+        hash_move_xor = self._hash_move
+        ai_code = self._AI
+        line_ai = self._line_ai
+        line_pl = self._line_pl
+        cell_lines = self._cell_lines
+
+        # Driver states: open a new node, fold a child result into its
+        # parent, advance to the parent's next move, or close a node.
+        OPEN, RET, ADV, CLOSE = 0, 1, 2, 3
+        mode = OPEN
+        top = -1
+        result = 0
+        nodes = 0
+
+        # Parameters of the node about to be opened
+        o_depth, o_turn, o_alpha, o_beta = depth, turn_max, alpha, beta
+        o_last = last_cell
+
+        while True:
+            if mode == OPEN:
+                value = None
+                hash_move: Union[int, None] = None
+                a, b = o_alpha, o_beta
+
+                # Only lines through the last move can have completed, so
+                # the win check is restricted to them whenever it is known.
+                score = (
+                    self._evaluate_board() if o_last is None
+                    else self._evaluate_board_at(o_last)
+                )
+
+                # Time budget and depth limit make this node a leaf. The
+                # clock is only consulted every 1024 nodes: a syscall per
+                # node would dwarf the per-node search work, and one batch
+                # overshoots the deadline by well under a millisecond.
+                nodes += 1
+                if use_time_limit and nodes & 1023 == 0 and self._is_time_exceeded():
+                    value = score
+                elif max_depth is not None and o_depth >= max_depth:
+                    value = score
+                else:
+                    # Probe the transposition table; bounded entries can
+                    # tighten the window or answer outright when searched
+                    # at least as deep as needed.
+                    remaining_depth = (
+                        max_depth - o_depth if max_depth is not None
+                        else self._TT_MAX_DEPTH
+                    )
+                    hashes = self._hashes
+                    key = min(hashes)
+                    sym = hashes.index(key)
+                    entry = cache.get(key)
+                    if entry is not None:
+                        cache.move_to_end(key)
+                        tt_value, entry_depth, flag, hash_move = entry
+                        if hash_move is not None:
+                            # Stored moves live in canonical orientation
+                            hash_move = self._inv_perms[sym][hash_move]
+                        if entry_depth >= remaining_depth:
+                            if flag == self._TT_EXACT:
+                                value = tt_value
+                            else:
+                                if flag == self._TT_LOWER:
+                                    a = max(a, tt_value)
+                                else:  # _TT_UPPER
+                                    b = min(b, tt_value)
+                                if a >= b:
+                                    value = tt_value
+
+                    if value is None:
+                        # Terminal conditions: win, loss, or draw
+                        if score:
+                            value = score - o_depth if score > 0 else score + o_depth
+                        elif empty not in board:
+                            value = 0
+
+                if value is not None:
+                    if top < 0:
+                        return value
+                    result = value
+                    mode = RET
+                    continue
+
+                # Interior node: claim a frame and iterate its moves, with
+                # the cached best move promoted to the front when present.
+                top += 1
+                frame = frames[top]
+                frame[self._F_DEPTH] = o_depth
+                frame[self._F_TURN] = o_turn
+                frame[self._F_ALPHA] = a
+                frame[self._F_BETA] = b
+                frame[self._F_ALPHA_ORIG] = o_alpha
+                frame[self._F_BEST] = _NEG_INF if o_turn else _POS_INF
+                frame[self._F_BEST_MOVE] = None
+                cells = self._ordered_cells
+                if hash_move is not None and hash_move != cells[0]:
+                    cells = [hash_move] + [c for c in cells if c != hash_move]
+                frame[self._F_CELLS] = cells
+                frame[self._F_IDX] = 0
+                frame[self._F_KEY] = key
+                frame[self._F_MARK] = self._AI if o_turn else self._PLAYER
+                frame[self._F_REMAIN] = remaining_depth
+                frame[self._F_SYM] = sym
+                mode = ADV
+                continue
+
+            frame = frames[top]
+
+            if mode == RET:
+                # A child finished: unmake its move and fold in the value
+                cell = frame[self._F_LAST]
+                mark = frame[self._F_MARK]
+                board[cell] = empty
+                counts = line_ai if mark == ai_code else line_pl
+                for line in cell_lines[cell]:
+                    counts[line] -= 1
+                hash_move_xor(cell, mark)
+
+                val = result
+                if frame[self._F_TURN]:
+                    if val > frame[self._F_BEST]:
+                        frame[self._F_BEST] = val
+                        frame[self._F_BEST_MOVE] = cell
+                    if val > frame[self._F_ALPHA]:
+                        frame[self._F_ALPHA] = val
+                else:
+                    if val < frame[self._F_BEST]:
+                        frame[self._F_BEST] = val
+                        frame[self._F_BEST_MOVE] = cell
+                    if val < frame[self._F_BETA]:
+                        frame[self._F_BETA] = val
+
+                # Alpha-beta pruning cutoff
+                if frame[self._F_BETA] <= frame[self._F_ALPHA]:
+                    mode = CLOSE
+                else:
+                    mode = ADV
+                continue
+
+            if mode == ADV:
+                # Advance to the next empty cell of this node's ordering
+                cells = frame[self._F_CELLS]
+                idx = frame[self._F_IDX]
+                total = len(cells)
+                cell = -1
+                while idx < total:
+                    candidate = cells[idx]
+                    idx += 1
+                    if board[candidate] == empty:
+                        cell = candidate
+                        break
+                frame[self._F_IDX] = idx
+
+                if cell < 0:
+                    mode = CLOSE
+                    continue
+
+                # Make the move and open the child node
+                mark = frame[self._F_MARK]
+                board[cell] = mark
+                counts = line_ai if mark == ai_code else line_pl
+                for line in cell_lines[cell]:
+                    counts[line] += 1
+                hash_move_xor(cell, mark)
+                frame[self._F_LAST] = cell
+                o_depth = frame[self._F_DEPTH] + 1
+                o_turn = not frame[self._F_TURN]
+                o_alpha = frame[self._F_ALPHA]
+                o_beta = frame[self._F_BETA]
+                o_last = cell
+                mode = OPEN
+                continue
+
+            # mode == CLOSE: all moves searched (or pruned). Store the value
+            # with its bound flag so later probes know whether it is exact
+            # or only a fail-high/fail-low bound, then pop the frame.
+            best = frame[self._F_BEST]
+            if best <= frame[self._F_ALPHA_ORIG]:
+                flag = self._TT_UPPER
+            elif best >= frame[self._F_BETA]:
+                flag = self._TT_LOWER
+            else:
+                flag = self._TT_EXACT
+            best_move = frame[self._F_BEST_MOVE]
+            if best_move is not None:
+                # Store the move in canonical orientation so any symmetric
+                # variant probing this entry can map it back to its board
+                best_move = self._perms[frame[self._F_SYM]][best_move]
+            tt_key = frame[self._F_KEY]
+            cache[tt_key] = (
+                best, frame[self._F_REMAIN], flag, best_move
+            )
+            cache.move_to_end(tt_key)
+            if len(cache) > self._TT_CAPACITY:
+                cache.popitem(last=False)
+            top -= 1
+            if top < 0:
+                return best
+            result = best
+            mode = RET
+
+
+    # ───────────────────────────────────────────────
+    # 6. Board Tools and Utilities 🧰
+    # ───────────────────────────────────────────────
+
+    def _get_remaining_moves(
+        self,
+        all_moves: bool = False,
+        mapping: bool = False
+    ) -> Union[List[Tuple[int, int]], Tuple[int, int], Literal[False]]:
+        """
+        Returns available positions on the board.
+
+        Args:
+            all_moves (bool): If True, returns a list of all available positions.
+                            If False, returns the first available position found.
+            mapping (bool): If True, uses the visual board (_mapping_moves);
+                            otherwise uses the logical board (_current_moves).
+
+        Returns:
+            List[Tuple[int, int]]: List of (row, col) coordinates if all_moves is True.
+            Tuple[int, int]: Single (row, col) coordinate if all_moves is False.
+            False: If the board is full (no available moves).
+
+        Raises:
+            TypeError: If 'all_moves' or 'mapping' are not booleans.
+        """
+        if not isinstance(all_moves, bool):
+            raise TypeError(f"'all_moves' must be bool, got {type(all_moves).__name__}")
+        if not isinstance(mapping, bool):
+            raise TypeError(f"'mapping' must be bool, got {type(mapping).__name__}")
+
+        # Scan the chosen board directly: visual or logical.
+        if mapping:
+            available: List[Tuple[int, int]] = [
+                (r, c)
+                for r, row in enumerate(self._mapping_moves)
+                for c, cell in enumerate(row)
+                if cell == UNDERSCORE
+            ]
+        else:
+            available = [
+                (r, c)
+                for r, row in enumerate(self._current_moves)
+                for c, move in enumerate(row)
+                if move.animal == EMPTY
+            ]
+
+        if all_moves:
+            return available
+        else:
+            return available[0] if available else False
+
+
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+"""
+Minimax Kernel - Optional Numba-Compiled Search for the AI Player
+
+This module hosts a flat-array implementation of the depth-limited
+alpha-beta search used by the HARD difficulty level. When NumPy and
+Numba are installed the kernel is JIT-compiled to machine code,
+removing the bytecode dispatch and boxed list indexing that dominate
+the interpreted recursion; otherwise AIPlayer transparently falls back
+to its pure-Python core and this module stays inert.
+
+Board encoding: a flat ``int8`` array of length size*size where
+0 = empty, 1 = AI mark, 2 = player mark. Winning combinations are
+encoded once per board layout as an ``int32[n_combos, line_len]``
+array of flat cell indices.
+
+The VERY_HARD search keeps its Python implementation because it relies
+on the wall-clock time limit and the Python transposition table.
+
+Author: Andrés David Aguilar Aguilar
+Date: 2025-07-18
+"""
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the extras
+    np = None
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+# Cell codes used by the flat board encoding
+EMPTY_CODE = 0
+AI_CODE = 1
+PLAYER_CODE = 2
+
+# Integer window sentinels (scores never leave the ±10 ± depth band)
+INF = 1 << 30
+
+
+# ───────────────────────────────────────────────
+# Board Marshalling Helpers ♻️
+# ───────────────────────────────────────────────
+
+def encode_board(mapping: Sequence[Sequence[str]], size: int, ai_mark: str, player_mark: str):
+    """
+    Converts the visual list-of-lists board into a flat int8 array.
+
+    Args:
+        mapping (Sequence[Sequence[str]]): Visual board with symbol cells.
+        size (int): Board size.
+        ai_mark (str): Symbol used by the AI.
+        player_mark (str): Symbol used by the human player.
+
+    Returns:
+        np.ndarray: Flat int8 board with EMPTY/AI/PLAYER cell codes.
+    """
+    board = np.zeros(size * size, dtype=np.int8)
+    for r in range(size):
+        for c in range(size):
+            cell = mapping[r][c]
+            if cell == ai_mark:
+                board[r * size + c] = AI_CODE
+            elif cell == player_mark:
+                board[r * size + c] = PLAYER_CODE
+    return board
+
+
+def encode_combos(winning_combos: Sequence[Sequence[Tuple[int, int]]], size: int):
+    """
+    Converts (row, col) winning combinations into flat index arrays.
+
+    Args:
+        winning_combos (Sequence[Sequence[Tuple[int, int]]]): Winning lines.
+        size (int): Board size.
+
+    Returns:
+        np.ndarray: int32 array of shape (n_combos, line_len).
+    """
+    return np.array(
+        [[r * size + c for r, c in combo] for combo in winning_combos],
+        dtype=np.int32,
+    )
+
+
+def move_order(size: int) -> List[int]:
+    """
+    Returns all flat cell indices sorted by static priority:
+    center first, then corners, then edges (stable row-major within ties).
+
+    Args:
+        size (int): Board size.
+
+    Returns:
+        List[int]: Flat indices in preferred search order.
+    """
+    center = size // 2
+
+    def priority(idx: int) -> int:
+        row, col = divmod(idx, size)
+        if (row, col) == (center, center):
+            return 3
+        if row in (0, size - 1) and col in (0, size - 1):
+            return 2
+        return 1
+
+    return sorted(range(size * size), key=priority, reverse=True)
+
+
+# ───────────────────────────────────────────────
+# Compiled Search Kernel ♟️
+# ───────────────────────────────────────────────
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _evaluate(board, combos):
+        """Returns +10 / -10 for a decided board, 0 otherwise."""
+        for i in range(combos.shape[0]):
+            first = board[combos[i, 0]]
+            if first == EMPTY_CODE:
+                continue
+            complete = True
+            for j in range(1, combos.shape[1]):
+                if board[combos[i, j]] != first:
+                    complete = False
+                    break
+            if complete:
+                return 10 if first == AI_CODE else -10
+        return 0
+
+    @njit(cache=True)
+    def _minimax(board, depth, turn_max, alpha, beta, max_depth, combos, order):
+        """Depth-limited alpha-beta search mirroring AIPlayer._minimax_core."""
+        score = _evaluate(board, combos)
+        if depth >= max_depth:
+            return score
+        if score == 10:
+            return score - depth
+        if score == -10:
+            return score + depth
+
+        has_empty = False
+        for i in range(board.shape[0]):
+            if board[i] == EMPTY_CODE:
+                has_empty = True
+                break
+        if not has_empty:
+            return 0
+
+        mark = AI_CODE if turn_max else PLAYER_CODE
+        best = -INF if turn_max else INF
+
+        for i in range(order.shape[0]):
+            cell = order[i]
+            if board[cell] != EMPTY_CODE:
+                continue
+
+            board[cell] = mark
+            val = _minimax(board, depth + 1, not turn_max, alpha, beta,
+                           max_depth, combos, order)
+            board[cell] = EMPTY_CODE
+
+            if turn_max:
+                if val > best:
+                    best = val
+                if val > alpha:
+                    alpha = val
+            else:
+                if val < best:
+                    best = val
+                if val < beta:
+                    beta = val
+
+            if beta <= alpha:
+                break
+
+        return best
@@ -1,352 +1,526 @@
-#!/usr/bin/env python3
-
-"""
-RANKING TOP PLAYERS MODULE - Player Rankings and Statistics Management
-
-This module manages the storage, retrieval, and presentation of player ranking data
-for the Tic Tac Toe game. It interacts with persistent storage to save player scores
-and wins, and provides formatted output for display in the UI and console.
-
-Responsibilities:
-- Load and initialize player ranking data from persistent storage.
-- Update and maintain player scores and win counts.
-- Save updated ranking data safely back to storage.
-- Format ranking tables with color-coded highlights for top players.
-- Provide interfaces for other modules to access ranking information.
-
-Structure:
-- Constants defining ANSI color codes for styled console output.
-- RankingTopPlayers class handling all ranking logic and persistence.
-- Methods for loading, saving, updating, and formatting ranking data.
-
-Author: Andrés David Aguilar Aguilar
-Date: 2025-07-11
-
-"""
-
-import logging
-import shelve
-from typing import Dict, List, Tuple, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from tic_tac_toe.core.logic_game import TicTacToeLogic
-
-from tic_tac_toe.core.enums import LabelType
-from tic_tac_toe.core.helper_methods import normalize_user, make_key
-from tic_tac_toe.core.literals import *
-from tic_tac_toe.core.paths import ROOT_PATH_DATA, RANKING_PLAYERS_SHELVE
-
-
-logger = logging.getLogger(__name__)
-
-# ─────────────────────────────────────────────────────────────────
-# ANSI escape codes for styled console output in player rankings
-# ─────────────────────────────────────────────────────────────────
-
-ANSI_SILVER = "\033[38;2;192;192;192m"        # Color used to indicate second place players
-ANSI_BRONZE = "\033[38;2;205;127;50m"         # Color applied to third place players
-ANSI_MAGENTA_SOFT = "\x1b[38;2;255;153;255m"  # Soft magenta used for subtle emphasis on ranking list borders
-
-
-class RankingTopPlayers:
-    """
-    Handles ranking data storage, retrieval and formatting for Tic Tac Toe players.
-
-    - Loads and initializes player scores and wins.
-    - Persists data in shelve-based storage.
-    - Generates formatted ranking tables for display.
-    """
-    RANKING_DB_PATH = ROOT_PATH_DATA / RANKING_PLAYERS_SHELVE
-    
-    # ───────────────────────────────────────────────
-    # 1. Initialization
-    # ───────────────────────────────────────────────
-
-    def __init__(self, logic_game: 'TicTacToeLogic'):
-        self._logic = logic_game
-        self._string_vars = {}
-        self._games = {}
-
-
-    # ───────────────────────────────────────────────
-    # 2. Properties (Accessors and Mutators)
-    # ───────────────────────────────────────────────
-
-    @property
-    def string_vars(self) -> dict:
-        """
-        Get the dictionary of string variables.
-
-        Returns:
-            dict: A dictionary containing string variables used in the class.
-        """
-        return self._string_vars
-
-
-    @string_vars.setter
-    def string_vars(self, new_vars: dict) -> None:
-        """
-        Replace the internal StringVar mapping with a new one.
-
-        Args:
-            new_vars (dict): Dictionary mapping keys to string representations of scores and wins.
-
-        This is useful when syncing GUI state with the backend logic after mode switches.
-        """
-        if not isinstance(new_vars, dict):
-            raise ValueError("Expected a dictionary for string_vars.")
-        self._string_vars = new_vars
-
-    
-    @property
-    def games(self) -> dict:
-        """
-        Get the dictionary of total games played per user.
-
-        Returns:
-            dict: Mapping of username → games played.
-        """
-        return self._games
-
-
-    @games.setter
-    def games(self, new_games: dict) -> None:
-        """
-        Set the dictionary of total games played per user.
-
-        Args:
-            new_games (dict): A dictionary mapping usernames to games played.
-        """
-        self._games = new_games
-
-
-    # ───────────────────────────────────────────────
-    # 3. Data Loading and Fallback Initialization
-    # ───────────────────────────────────────────────
-
-    def _load_player_statistics(self, user: str, opponent_name: str) -> None:
-        """
-        Load wins, games and score from persistent storage (shelve) into string variables.
-
-        Args:
-            user: The current user's name.
-            opponent_name: The opponent's user name.
-        """
-        users = [user, opponent_name, MACHINE]
-
-        try:
-            with shelve.open(self.RANKING_DB_PATH) as previous_ranking:
-                for user in users:
-                    normalized_user = normalize_user(user)
-                    user_data = previous_ranking.get(user, {})
-
-                    for label in LabelType:
-                        key = make_key(label.value, normalized_user)
-                        default_val = DEFAULT_WINS if label == LabelType.WINS else DEFAULT_SCORE
-                        val = user_data.get(label.value.lower(), default_val)
-                        self._string_vars[key] = val
-                    self._games[user] = user_data.get('games', DEFAULT_GAMES)
-                
-        except (OSError, IOError) as e:
-            logger.warning(
-                f"Could not load rankings for user '{user}' or opponent '{opponent_name}': {e}"
-            )
-            self._initialize_default_scores(users)
-
-
-    def _initialize_default_scores(self, users: List[str]) -> None:
-        """
-        Initialize default scores and wins for given users.
-
-        Args:
-            users: List of usernames to initialize.
-        """
-        for user in users:
-            normalized_user = normalize_user(user)
-            for label in LabelType:
-                key = make_key(label.value, normalized_user)
-                default_val = DEFAULT_WINS if label == LabelType.WINS else DEFAULT_SCORE
-                self._string_vars[key] = default_val
-            self._games[user] = DEFAULT_GAMES
-
-
-    # ───────────────────────────────────────────────
-    # 4. Data Storage and Updating
-    # ───────────────────────────────────────────────
-
-    def _store_ranking(self) -> str:
-        """
-        Save the current top players list to the shelve database,
-        display the ranking.
-        """
-        with shelve.open(self.RANKING_DB_PATH, flag='c') as db:
-            for player_name in self._games:
-                data = self._get_player_stats(player_name)
-                db[player_name] = data
-
-        return self._show_current_ranking()
-
-
-    def _get_player_stats(self, player_name: str) -> Dict[str, object]:
-        """
-        Compute and return the player's stats dictionary for storage.
-
-        Args:
-            player_name (str): The username of the player.
-
-        Returns:
-            Dict[str, object]: Dictionary containing wins, score, games played, and win rate percentage.
-        """
-        normalized_player = normalize_user(player_name)
-
-        wins_key = make_key(LabelType.WINS.value, normalized_player)
-        score_key = make_key(LabelType.SCORE.value, normalized_player)
-
-        def get_value(key):
-            val = self._string_vars.get(key, 0)
-            # Attempt to get the real value if it's a StringVar
-            if hasattr(val, 'get') and callable(val.get):
-                try:
-                    return int(val.get())
-                except Exception:
-                    return 0
-            try:
-                return int(val)
-            except Exception:
-                return 0
-
-        wins = get_value(wins_key)
-        score = get_value(score_key)
-
-        games = int(self._games.get(player_name, 0))
-
-        try:
-            win_rate = round((wins / games) * 100, 2)
-        except ZeroDivisionError:
-            win_rate = 0.0
-
-        return {
-            'wins': wins,
-            'score': score,
-            'games': games,
-            'rate': f"{win_rate} %"
-        }
-
-
-    # ───────────────────────────────────────────────
-    # 5. Display Formatting Methods
-    # ───────────────────────────────────────────────
-
-    def _show_current_ranking(self) -> str:
-        """
-        Retrieve the current ranking from storage, format and print it.
-
-        Returns:
-            str: Formatted string of the current ranking table.
-        """
-        with shelve.open(self.RANKING_DB_PATH) as db:
-            ranking_list: List[Tuple[str, int, int, int, str]] = [
-                (
-                    player, int(data[WINS.lower()]), 
-                    int(data[SCORE.lower()]), 
-                    int(data[GAMES.lower()]), 
-                    data[RATE.lower()]
-                )
-                for player, data in db.items()
-            ]
-
-        ranking_list.sort(
-            key=lambda x: (float(x[4].split()[0]), x[2]),  # (Sort by rate, score)
-            reverse=True
-        )
-
-        headers = [POS, USER, GAMES, WINS, SCORE, RATE]
-        col_widths = [11, 20, 13, 12, 13, 14]
-
-        title = f"{ANSI_MAGENTA_SOFT}" + " 😎 TOP PLAYERS LIST 😎 ".center(88, '-') + f"{RESET_COLOR}"
-        border_line = f"{ANSI_MAGENTA_SOFT}" + "-" * 90 + f"{RESET_COLOR}"
-
-        ranking_str = f"\n{title}\n"
-        ranking_str += self._format_ranking_header(headers, col_widths) + "\n"
-
-        for idx, player_stats in enumerate(ranking_list, 1):
-            ranking_str += self._format_ranking_line(idx, player_stats, headers, col_widths) + "\n"
-
-        ranking_str += f"{border_line}\n\n"
-
-        print(ranking_str)
-        return ranking_str
-
-
-    def _format_ranking_header(self, headers: List[str], col_widths: List[int]) -> str:
-        """
-        Format and return the ranking table header string with colored pipes and olive-colored underscores.
-        """
-        header_line = ""
-        for header, width in zip(headers, col_widths):
-            header_line += f"{ANSI_AQUAMARINE}|"
-            header_text = header.center(width, UNDERSCORE)
-            header_line += f"{header_text}"
-        header_line += f"|{RESET_COLOR}"
-        return header_line
-
-
-    def _format_ranking_line(
-        self,
-        position: int,
-        player_stats: Tuple[str, int, int, int, str],
-        headers: List[str],
-        col_widths: List[int]
-        ) -> str:
-        """
-        Format a single line of the ranking table with colors and padding.
-
-        Args:
-            position (int): The player's position in the ranking.
-            player_stats (Tuple[str, int, int, int, str]): Player's stats (username, wins, score, games, rate).
-            headers (List[str]): List of column headers.
-            col_widths (List[int]): Corresponding widths for each column.
-
-        Returns:
-            str: Formatted colored string representing one row of the ranking table.
-        """
-        user, wins, score, games, rate = player_stats
-        ansi_user_color = self._logic.get_ansi_color_for_user(user)
-
-        pos_color = {
-            1: ANSI_GOLD,
-            2: ANSI_SILVER,
-            3: ANSI_BRONZE
-        }.get(position, ANSI_AQUAMARINE)
-
-        if pos_color != ANSI_AQUAMARINE:
-            ansi_user_color = pos_color
-
-        def colorize(text: str, color: str) -> str:
-            return f"{color}{text}{RESET_COLOR}"
-
-        line = ANSI_AQUAMARINE
-        for header, width in zip(headers, col_widths):
-            line += f"{ANSI_AQUAMARINE}|{RESET_COLOR}"
-            if header == POS:
-                pos_str = str(position).center(width)
-                pos_str = colorize(pos_str, pos_color)
-                line += pos_str
-            elif header == USER:
-                user_str = colorize(user.center(width), ansi_user_color)
-                line += user_str
-            elif header == WINS:
-                wins_str = colorize(str(wins).zfill(2).center(width), ansi_user_color)
-                line += wins_str
-            elif header == SCORE:
-                score_str = colorize(str(score).zfill(3).center(width), ansi_user_color)
-                line += score_str
-            elif header == GAMES:
-                games_str = colorize(str(games).zfill(3).center(width), ansi_user_color)
-                line += games_str
-            elif header == RATE:
-                rate_str = colorize(rate.center(width), ansi_user_color)
-                line += rate_str
-
-        line += f"{ANSI_AQUAMARINE}|{RESET_COLOR}"
-        return line
+#!/usr/bin/env python3
+
+"""
+RANKING TOP PLAYERS MODULE - Player Rankings and Statistics Management
+
+This module manages the storage, retrieval, and presentation of player ranking data
+for the Tic Tac Toe game. It interacts with persistent storage to save player scores
+and wins, and provides formatted output for display in the UI and console.
+
+Responsibilities:
+- Load and initialize player ranking data from persistent storage.
+- Update and maintain player scores and win counts.
+- Save updated ranking data safely back to storage.
+- Format ranking tables with color-coded highlights for top players.
+- Provide interfaces for other modules to access ranking information.
+
+Structure:
+- Constants defining ANSI color codes for styled console output.
+- RankingTopPlayers class handling all ranking logic and persistence.
+- Methods for loading, saving, updating, and formatting ranking data.
+
+Author: Andrés David Aguilar Aguilar
+Date: 2025-07-11
+
+"""
+
+import dbm
+import json
+import logging
+import os
+import shelve
+import sys
+from operator import itemgetter
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tic_tac_toe.core.logic_game import TicTacToeLogic
+
+from tic_tac_toe.core.enums import LabelType
+from tic_tac_toe.core.helper_methods import normalize_user, make_key
+from tic_tac_toe.core.literals import *
+from tic_tac_toe.core.paths import (
+    ROOT_PATH_DATA, RANKING_PLAYERS_JSON, RANKING_PLAYERS_SHELVE
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Snapshot of the label enum, so per-user loops don't re-iterate the
+# enum machinery on every call
+LABELS = list(LabelType)
+
+# Loop-invariant per-label data, hoisted out of the per-user loops:
+# the default stored value and the lowered shelve field name
+_LABEL_DEFAULTS = {
+    label: DEFAULT_WINS if label == LabelType.WINS else DEFAULT_SCORE
+    for label in LABELS
+}
+_LABEL_LC = {label: label.value.lower() for label in LABELS}
+
+# Stored field names, lowered once at import and interned so record
+# lookups hit the identity fast path of dict key comparison
+_W = sys.intern(WINS.lower())
+_S = sys.intern(SCORE.lower())
+_G = sys.intern(GAMES.lower())
+_R = sys.intern(RATE.lower())
+
+# Column separator fragment shared by every row
+_PIPE = f"{ANSI_AQUAMARINE}|{RESET_COLOR}"
+
+# C-level extraction of the four stat fields in one call
+_GET_STATS = itemgetter(_W, _S, _G, _R)
+
+# ─────────────────────────────────────────────────────────────────
+# ANSI escape codes for styled console output in player rankings
+# ─────────────────────────────────────────────────────────────────
+
+ANSI_SILVER = "\033[38;2;192;192;192m"        # Color used to indicate second place players
+ANSI_BRONZE = "\033[38;2;205;127;50m"         # Color applied to third place players
+ANSI_MAGENTA_SOFT = "\x1b[38;2;255;153;255m"  # Soft magenta used for subtle emphasis on ranking list borders
+
+
+def _coerce_int(val) -> int:
+    """
+    Convert a stored stat (plain value or tk.StringVar) to an int.
+
+    Module-level so the stats path doesn't rebuild a closure per player,
+    with excepts narrowed to the actual conversion failures.
+
+    Args:
+        val: Raw value from the string-vars mapping.
+
+    Returns:
+        int: The converted value, or 0 when conversion fails.
+    """
+    getter = getattr(val, 'get', None)
+    if getter is not None:
+        try:
+            return int(getter())
+        except (TypeError, ValueError):
+            return 0
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _normalize_record(record: dict) -> dict:
+    """
+    Coerce a legacy shelve record into the JSON record layout.
+
+    Old versions stored the win rate as an "xx %" string; the JSON store
+    keeps all four stats numeric so sorting and rendering never parse.
+
+    Args:
+        record: Raw record read from the legacy shelve.
+
+    Returns:
+        dict: Record with integer wins/score/games and a float rate.
+    """
+    wins = _coerce_int(record.get(_W, 0))
+    score = _coerce_int(record.get(_S, 0))
+    games = _coerce_int(record.get(_G, 0))
+    try:
+        rate = float(str(record.get(_R, 0.0)).replace('%', '').strip())
+    except ValueError:
+        rate = round(wins * 100 / games, 2) if games else 0.0
+    return {_W: wins, _S: score, _G: games, _R: rate}
+
+
+class RankingTopPlayers:
+    """
+    Handles ranking data storage, retrieval and formatting for Tic Tac Toe players.
+
+    - Loads and initializes player scores and wins.
+    - Persists data in shelve-based storage.
+    - Generates formatted ranking tables for display.
+    """
+    RANKING_DB_PATH = ROOT_PATH_DATA / RANKING_PLAYERS_JSON
+
+    # Store used by versions that persisted rankings through shelve;
+    # its contents are imported once when the JSON file does not exist
+    LEGACY_SHELVE_PATH = ROOT_PATH_DATA / RANKING_PLAYERS_SHELVE
+
+    # Medal colors of the podium positions; every other row keeps the
+    # table's aquamarine accent
+    _POS_COLORS = {1: ANSI_GOLD, 2: ANSI_SILVER, 3: ANSI_BRONZE}
+
+    # Table layout is fixed, so the header, title and border strings are
+    # folded to constants once at class creation instead of per render
+    _HEADERS = (POS, USER, GAMES, WINS, SCORE, RATE)
+    _COL_WIDTHS = (11, 20, 13, 12, 13, 14)
+    _HEADER_LINE = "".join(
+        f"{ANSI_AQUAMARINE}|" + header.center(width, UNDERSCORE)
+        for header, width in zip(_HEADERS, _COL_WIDTHS)
+    ) + f"|{RESET_COLOR}"
+    _TITLE = ANSI_MAGENTA_SOFT + " 😎 TOP PLAYERS LIST 😎 ".center(88, '-') + RESET_COLOR
+    _BORDER_LINE = ANSI_MAGENTA_SOFT + "-" * 90 + RESET_COLOR
+    
+    # ───────────────────────────────────────────────
+    # 1. Initialization
+    # ───────────────────────────────────────────────
+
+    def __init__(self, logic_game: 'TicTacToeLogic'):
+        self._logic = logic_game
+        self._string_vars = {}
+        self._games = {}
+        self._db = None
+        self._dirty = False
+
+
+    def _db_handle(self) -> dict:
+        """
+        Return the in-memory ranking table, loading it lazily on first use.
+
+        The whole table is one JSON document read once per session; all
+        load/store/show paths then work on the plain dict until _flush()
+        writes it back in a single encode.
+
+        Returns:
+            dict: Player name -> stats record mapping.
+        """
+        if self._db is None:
+            try:
+                with open(self.RANKING_DB_PATH, encoding='utf-8') as fh:
+                    self._db = json.load(fh)
+            except FileNotFoundError:
+                # First run on the JSON store: carry forward any history
+                # the old shelve-based versions left behind
+                self._db = self._import_legacy_shelve()
+                if self._db:
+                    self._dirty = True
+                    self._flush()
+            except (OSError, ValueError):
+                self._db = {}
+        return self._db
+
+
+    def _import_legacy_shelve(self) -> dict:
+        """
+        One-time import of the ranking records kept by the old shelve
+        store, normalized to the JSON record layout.
+
+        Depending on the dbm backend, the shelve may live at the bare
+        path or under backend-specific suffixes, so presence is checked
+        by globbing the file name. Unreadable stores (e.g. written by a
+        dbm backend this interpreter lacks) log a warning and yield an
+        empty table rather than blocking startup.
+
+        Returns:
+            dict: Player name -> stats record mapping, empty when no
+                legacy store exists or it cannot be read.
+        """
+        pattern = self.LEGACY_SHELVE_PATH.name + '*'
+        if not any(self.LEGACY_SHELVE_PATH.parent.glob(pattern)):
+            return {}
+        try:
+            with shelve.open(str(self.LEGACY_SHELVE_PATH), flag='r') as shelf:
+                return {
+                    user: _normalize_record(record)
+                    for user, record in shelf.items()
+                }
+        # dbm.error is already a tuple that includes OSError
+        except dbm.error as e:
+            logger.warning(f"Could not import legacy ranking shelve: {e}")
+            return {}
+
+
+    def _flush(self) -> None:
+        """
+        Push buffered ranking writes to disk, if there are any.
+
+        Stores only mark the in-memory table dirty; the write happens
+        here as one JSON dump to a temp file swapped in with os.replace,
+        so any number of consecutive saves coalesce into one atomic
+        single-fsync write.
+        """
+        if self._dirty and self._db is not None:
+            tmp_path = self.RANKING_DB_PATH.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as fh:
+                json.dump(self._db, fh)
+            os.replace(tmp_path, self.RANKING_DB_PATH)
+            self._dirty = False
+
+
+    def close(self) -> None:
+        """
+        Flush the ranking table and drop the in-memory copy.
+
+        Called on game shutdown so the last writes reach disk.
+        """
+        if self._db is not None:
+            self._flush()
+            self._db = None
+
+
+    # ───────────────────────────────────────────────
+    # 2. Properties (Accessors and Mutators)
+    # ───────────────────────────────────────────────
+
+    @property
+    def string_vars(self) -> dict:
+        """
+        Get the dictionary of string variables.
+
+        Returns:
+            dict: A dictionary containing string variables used in the class.
+        """
+        return self._string_vars
+
+
+    @string_vars.setter
+    def string_vars(self, new_vars: dict) -> None:
+        """
+        Replace the internal StringVar mapping with a new one.
+
+        Args:
+            new_vars (dict): Dictionary mapping keys to string representations of scores and wins.
+
+        This is useful when syncing GUI state with the backend logic after mode switches.
+        """
+        if not isinstance(new_vars, dict):
+            raise ValueError("Expected a dictionary for string_vars.")
+        self._string_vars = new_vars
+
+    
+    @property
+    def games(self) -> dict:
+        """
+        Get the dictionary of total games played per user.
+
+        Returns:
+            dict: Mapping of username → games played.
+        """
+        return self._games
+
+
+    @games.setter
+    def games(self, new_games: dict) -> None:
+        """
+        Set the dictionary of total games played per user.
+
+        Args:
+            new_games (dict): A dictionary mapping usernames to games played.
+        """
+        # Copy defensively: the logic hands out read-only views, and the
+        # ranking fills in fallback entries for unseen users
+        self._games = dict(new_games)
+
+
+    # ───────────────────────────────────────────────
+    # 3. Data Loading and Fallback Initialization
+    # ───────────────────────────────────────────────
+
+    def _load_player_statistics(self, user: str, opponent_name: str) -> None:
+        """
+        Load wins, games and score from the persistent ranking table into string variables.
+
+        Args:
+            user: The current user's name.
+            opponent_name: The opponent's user name.
+        """
+        users = [user, opponent_name, MACHINE]
+
+        # The loop variable must not shadow the 'user' parameter: the old
+        # 'for user in users' left it rebound to the last-iterated name,
+        # corrupting the warning below and any later use of the argument.
+        try:
+            previous_ranking = self._db_handle()
+            for u in users:
+                normalized_user = normalize_user(u)
+                user_data = previous_ranking.get(u, {})
+
+                for label in LABELS:
+                    key = make_key(label.value, normalized_user)
+                    val = user_data.get(_LABEL_LC[label], _LABEL_DEFAULTS[label])
+                    self._string_vars[key] = val
+                self._games[u] = user_data.get('games', DEFAULT_GAMES)
+
+        except (OSError, IOError) as e:
+            logger.warning(
+                f"Could not load rankings for user '{user}' or opponent '{opponent_name}': {e}"
+            )
+            # Only default-init the users that were not loaded before the
+            # failure instead of redoing the whole list
+            self._initialize_default_scores(
+                [u for u in users if u not in self._games]
+            )
+
+
+    def _initialize_default_scores(self, users: List[str]) -> None:
+        """
+        Initialize default scores and wins for given users.
+
+        Args:
+            users: List of usernames to initialize.
+        """
+        for user in users:
+            normalized_user = normalize_user(user)
+            for label in LABELS:
+                key = make_key(label.value, normalized_user)
+                self._string_vars[key] = _LABEL_DEFAULTS[label]
+            self._games[user] = DEFAULT_GAMES
+
+
+    # ───────────────────────────────────────────────
+    # 4. Data Storage and Updating
+    # ───────────────────────────────────────────────
+
+    def _store_ranking(self) -> str:
+        """
+        Save the current top players list to the ranking table in one
+        batched update, then display the ranking.
+        """
+        batch = {
+            player_name: self._get_player_stats(player_name)
+            for player_name in self._games
+        }
+
+        # Write-behind: the update lands in the in-memory table and is
+        # only marked dirty here; _flush()/close() perform the disk write
+        self._db_handle().update(batch)
+        self._dirty = True
+
+        # Render from the full table, not the session batch: players with
+        # records from earlier runs must keep appearing in the ranking
+        return self._show_current_ranking()
+
+
+    def _get_player_stats(self, player_name: str) -> Dict[str, object]:
+        """
+        Compute and return the player's stats dictionary for storage.
+
+        Args:
+            player_name (str): The username of the player.
+
+        Returns:
+            Dict[str, object]: Dictionary containing wins, score, games played, and win rate percentage.
+        """
+        normalized_player = normalize_user(player_name)
+
+        wins_key = make_key(LabelType.WINS.value, normalized_player)
+        score_key = make_key(LabelType.SCORE.value, normalized_player)
+
+        wins = _coerce_int(self._string_vars.get(wins_key, 0))
+        score = _coerce_int(self._string_vars.get(score_key, 0))
+
+        games = int(self._games.get(player_name, 0))
+
+        # Branch instead of raise/catch: new players always have 0 games
+        win_rate = round(wins * 100 / games, 2) if games else 0.0
+
+        # Stored numerically; the "%" suffix is applied at display time so
+        # sorting never has to parse it back out of a string.
+        return {
+            'wins': wins,
+            'score': score,
+            'games': games,
+            'rate': win_rate
+        }
+
+
+    # ───────────────────────────────────────────────
+    # 5. Display Formatting Methods
+    # ───────────────────────────────────────────────
+
+    def _show_current_ranking(self, snapshot: Dict[str, dict] = None, echo: bool = True) -> str:
+        """
+        Format the current ranking table, optionally echoing it to stdout.
+
+        Args:
+            snapshot: Already-materialized player records to render
+                instead of the stored table. When omitted, the full
+                in-memory table is used.
+            echo: Write the table to stdout. Pass False when only the
+                returned string is needed (e.g. for logs or the GUI).
+
+        Returns:
+            str: Formatted string of the current ranking table.
+        """
+        # Snapshot the records first so row construction is detached from
+        # the database iteration
+        rows = list(snapshot.items() if snapshot is not None else self._db_handle().items())
+        ranking_list: List[Tuple[str, int, int, int, float]] = []
+        for player, data in rows:
+            wins, score, games, rate = _GET_STATS(data)
+            ranking_list.append((player, int(wins), int(score), int(games), float(rate)))
+
+        # (Sort by rate, score) — itemgetter compares the stored floats
+        # directly instead of re-parsing a "xx %" string per comparison
+        ranking_list.sort(key=itemgetter(4, 2), reverse=True)
+
+        # One logic-layer color lookup per user per render; the row
+        # formatter then reads a plain dict
+        user_colors = {
+            row[0]: self._logic.get_ansi_color_for_user(row[0])
+            for row in ranking_list
+        }
+
+        ranking_str = f"\n{self._TITLE}\n"
+        ranking_str += self._format_ranking_header() + "\n"
+
+        for idx, player_stats in enumerate(ranking_list, 1):
+            ranking_str += self._format_ranking_line(idx, player_stats, self._COL_WIDTHS, user_colors) + "\n"
+
+        ranking_str += f"{self._BORDER_LINE}\n\n"
+
+        if echo:
+            # One buffered write instead of print's formatting machinery
+            sys.stdout.write(ranking_str)
+            sys.stdout.write("\n")
+        return ranking_str
+
+
+    def _format_ranking_header(self) -> str:
+        """
+        Return the ranking table header string with colored pipes and
+        underscore padding, precomputed once at class creation.
+        """
+        return self._HEADER_LINE
+
+
+    def _format_ranking_line(
+        self,
+        position: int,
+        player_stats: Tuple[str, int, int, int, float],
+        col_widths: Tuple[int, ...],
+        user_colors: Dict[str, str]
+        ) -> str:
+        """
+        Format a single line of the ranking table with colors and padding.
+
+        The six columns are fixed, so the row is assembled as one
+        straight-line join of pre-colored cells instead of dispatching on
+        header names and growing the string piecewise.
+
+        Args:
+            position (int): The player's position in the ranking.
+            player_stats (Tuple[str, int, int, int, float]): Player's stats (username, wins, score, games, rate).
+            col_widths (Tuple[int, ...]): Corresponding widths for each column.
+            user_colors (Dict[str, str]): Precomputed ANSI color per user.
+
+        Returns:
+            str: Formatted colored string representing one row of the ranking table.
+        """
+        user, wins, score, games, rate = player_stats
+        w_pos, w_user, w_games, w_wins, w_score, w_rate = col_widths
+
+        pos_color = self._POS_COLORS.get(position, ANSI_AQUAMARINE)
+        if pos_color != ANSI_AQUAMARINE:
+            ansi_user_color = pos_color
+        else:
+            ansi_user_color = user_colors[user]
+
+        reset = RESET_COLOR
+
+        return "".join((
+            ANSI_AQUAMARINE,
+            _PIPE, pos_color, str(position).center(w_pos), reset,
+            _PIPE, ansi_user_color, user.center(w_user), reset,
+            _PIPE, ansi_user_color, str(games).zfill(3).center(w_games), reset,
+            _PIPE, ansi_user_color, str(wins).zfill(2).center(w_wins), reset,
+            _PIPE, ansi_user_color, str(score).zfill(3).center(w_score), reset,
+            _PIPE, ansi_user_color, f"{rate:.2f} %".center(w_rate), reset,
+            _PIPE,
+        ))
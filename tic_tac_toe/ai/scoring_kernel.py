@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""
+Scoring Kernel - Optional Numba-Compiled Heuristic Scoring for the AI
+
+This module hosts a flat-array implementation of the boost-scoring pass
+run by AIPlayer._apply_boost. When NumPy and Numba are installed the
+per-line rule cascade is JIT-compiled to machine code; otherwise the
+module stays inert and AIPlayer keeps its pure-Python (lru_cached)
+scoring path.
+
+Board encoding matches minimax_kernel: a flat ``int8`` array with
+0 = empty, 1 = AI mark, 2 = player mark, and winning combinations as
+an ``int32[n_combos, line_len]`` array of flat cell indices. The
+positional and symmetry bonuses are position-only, so they are baked
+into per-cell / per-line float tables once per board layout.
+
+Author: Andrés David Aguilar Aguilar
+Date: 2025-07-18
+"""
+
+from typing import Sequence, Tuple
+
+from tic_tac_toe.ai.minimax_kernel import (
+    AI_CODE,
+    EMPTY_CODE,
+    PLAYER_CODE,
+    encode_combos,
+)
+from tic_tac_toe.core.helper_methods import _pos_score_table, symmetry_score
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the extras
+    np = None
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+# Per-size cache of the encoded combos and bonus tables
+_TABLE_CACHE: dict = {}
+
+
+def get_tables(size: int, winning_combos: Sequence[Sequence[Tuple[int, int]]]):
+    """
+    Returns the kernel inputs derived from a board layout, cached per size.
+
+    Args:
+        size (int): Board size.
+        winning_combos (Sequence[Sequence[Tuple[int, int]]]): Winning lines.
+
+    Returns:
+        tuple: (combos int32 array, per-cell positional float64 table,
+            per-line symmetry float64 table).
+    """
+    tables = _TABLE_CACHE.get(size)
+    if tables is None:
+        combos = encode_combos(winning_combos, size)
+        pos_table = np.array(_pos_score_table(size), dtype=np.float64)
+        sym_table = np.array(
+            [symmetry_score(tuple(combo), size) for combo in winning_combos],
+            dtype=np.float64,
+        )
+        tables = (combos, pos_table, sym_table)
+        _TABLE_CACHE[size] = tables
+    return tables
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def boost_stats(skip_board, score_board, combos, pos_table, sym_table):
+        """
+        Streams the boost score of every undecided line.
+
+        Mirrors the pure-Python path: lines already won on ``skip_board``
+        are ignored, counts and bonuses come from ``score_board``, and
+        each line score is truncated to int exactly like
+        ``int(calculate_boost_score(...))``.
+
+        Returns:
+            tuple: (total, max_boost, max_count); max_count == 0 means
+                no line was scored.
+        """
+        line_len = combos.shape[1]
+        total = 0.0
+        max_boost = -(1 << 30)
+        max_count = 0
+
+        for i in range(combos.shape[0]):
+            first = skip_board[combos[i, 0]]
+            if first != EMPTY_CODE:
+                decided = True
+                for j in range(1, line_len):
+                    if skip_board[combos[i, j]] != first:
+                        decided = False
+                        break
+                if decided:
+                    continue
+
+            ai = 0
+            player = 0
+            for j in range(line_len):
+                value = score_board[combos[i, j]]
+                if value == AI_CODE:
+                    ai += 1
+                elif value == PLAYER_CODE:
+                    player += 1
+
+            if ai and player:
+                score = 0
+            else:
+                empty = line_len - ai - player
+
+                positional_bonus = 0.0
+                for j in range(line_len):
+                    if score_board[combos[i, j]] == EMPTY_CODE:
+                        positional_bonus += pos_table[combos[i, j]]
+
+                base_score = 0.0
+                if ai == line_len - 1 and empty == 1:
+                    base_score += 100.0
+                if player == line_len - 1 and empty == 1:
+                    base_score += 90.0
+                if ai == line_len - 2 and empty == 2:
+                    base_score += 15.0
+                if player == line_len - 2 and empty == 2:
+                    base_score += 14.0
+                if ai == line_len - 3 and empty == 3:
+                    base_score += 6.0
+                if player == line_len - 3 and empty == 3:
+                    base_score += 5.0
+                if ai == 1 and empty == line_len - 1:
+                    base_score += 3.0
+                if player == 1 and empty == line_len - 1:
+                    base_score += 2.0
+                if empty == line_len:
+                    base_score += 1.0
+                if ai == line_len - 2 and player == 0 and empty == 2:
+                    base_score += 5.0
+                if player > ai and empty > 0:
+                    base_score -= 2.0
+
+                raw = base_score + positional_bonus + sym_table[i]
+                rounded = np.floor(raw * 10000.0 + 0.5) / 10000.0
+                score = int(rounded)
+
+            total += score
+            if score > max_boost:
+                max_boost = score
+                max_count = 1
+            elif score == max_boost:
+                max_count += 1
+
+        return total, max_boost, max_count
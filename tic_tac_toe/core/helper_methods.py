@@ -1,406 +1,671 @@
-#!/usr/bin/env python3
-
-"""
-TicTacToe Helper Methods - Utility Functions for Game Logic and AI Scoring
-
-This module provides reusable utility functions that support various parts of the
-Tic Tac Toe project, including positional evaluation, board transformations,
-symmetry detection, and scoring heuristics for AI levels.
-
-- Generic Utilities (Normalization, Keys, Labels)
-- Board Serialization and Conversion
-- AI Scoring and Heuristics
-- Positional and Symmetry Bonuses
-
-These functions aim to promote code reuse, modularity, and clarity throughout the project.
-
-Compatible with: Windows, macOS, Linux (UTF-8, ANSI colors supported)
-
-Author: Andrés David Aguilar Aguilar  
-Date: 2025-07-16
-"""
-
-import re
-from typing import List, Optional, Tuple, Sequence
-
-from tic_tac_toe.core.enums import WidgetKey, LabelType
-from tic_tac_toe.core.literals import *
-
-ANSI_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-
-
-# ───────────────────────────────────────────────
-# Positional Evaluation Helpers 📍
-# ───────────────────────────────────────────────
-
-def positional_score_extended(row: int, col: int, size: int) -> float:
-    """
-    Returns a positional bonus based on key board areas:
-    center, corners, diagonals, symmetry axes, and edges.
-
-    Args:
-        row (int): Row index.
-        col (int): Column index.
-        size (int): Board size.
-
-    Returns:
-        float: Total bonus score based on position.
-    """
-    center = size // 2
-    score = 0.0
-
-    # Determine center positions based on even/odd board size
-    center_cells = (
-        {(center, center)} if size % 2 == 1 else
-        {(center - 1, center - 1), (center - 1, center),
-         (center, center - 1), (center, center)}
-    )
-
-    # Positional bonus rules
-    bonuses = [
-        (0.15, (row, col) in center_cells),  # Center bonus
-        (0.08, (row, col) in {(0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1)}),  # Corners
-        (0.05, row == col or row + col == size - 1),  # Diagonals
-        (0.04, row == center or col == center),  # Center row/col
-        (0.02, row in (0, size - 1) or col in (0, size - 1))  # Edges
-    ]
-
-    for bonus, condition in bonuses:
-        if condition:
-            score += bonus
-
-    return round(score, 4)
-
-
-def symmetry_score(positions: Sequence[Tuple[int, int]], size: int) -> float:
-    """
-    Computes bonus based on symmetry: diagonal alignment and center involvement.
-
-    Args:
-        positions (Sequence[Tuple[int, int]]): Coordinates in a potential combo.
-        size (int): Board size.
-
-    Returns:
-        float: Bonus score for symmetry patterns.
-    """
-    if not positions:
-        return 0.0
-
-    center = size // 2
-    center_coords = (
-        {(center, center)} if size % 2 == 1 else
-        {(center - 1, center - 1), (center - 1, center),
-         (center, center - 1), (center, center)}
-    )
-
-    # Bonus conditions for symmetry
-    conditions = [
-        (1.5, all(r == c for r, c in positions)),              # Main diagonal
-        (1.5, all(r + c == size - 1 for r, c in positions)),   # Anti-diagonal
-        (1.0, any(pos in center_coords for pos in positions)), # Center involvement
-        (0.5, any(r == center for r, _ in positions)),         # Center row
-        (0.5, any(c == center for _, c in positions))          # Center column
-    ]
-
-    return sum(bonus for bonus, condition in conditions if condition)
-
-
-# ───────────────────────────────────────────────
-# Generic Utility Functions 🧩
-# ───────────────────────────────────────────────
-
-def get_zfill_pad(label: LabelType) -> int:
-    """
-    Return the zero-padding width for a given label type.
-
-    This is used to format numeric fields (like scores or wins) with leading zeros
-    in the ranking display or UI elements.
-
-    Args:
-        label (LabelType): The label type ('score', 'wins', etc.).
-
-    Returns:
-        int: Number of digits to pad with zeros (e.g., 3 → '007', 2 → '05').
-             Defaults to 0 for unsupported or non-numeric label types.
-    """
-    match label:
-        case LabelType.SCORE:
-            return 3
-        case LabelType.WINS:
-            return 2
-        case _:
-            return 0
-        
-
-def make_key(label: str, normalized_username: str, extra_label: Optional[str] = None) -> WidgetKey:
-    """
-    Create a unique key tuple for dictionary lookups to avoid string concatenation.
-
-    Args:
-        label (str): Label type string (e.g., 'score', 'wins').
-        normalized_username (str): Normalized username string.
-        extra_label (Optional[str]): Optional extra label for further key distinction.
-
-    Returns:
-        WidgetKey: NamedTuple key for dict storage.
-    """
-    return WidgetKey(label.lower(), normalized_username.lower(), extra_label.lower() if extra_label else None)
-
-
-def normalize_user(user: str) -> str:
-    """
-    Normalize a username by removing newlines and replacing spaces with underscores.
-
-    Args:
-        user (str): The username string to normalize.
-
-    Returns:
-        str: The normalized username.
-    """
-    return user.replace('\n', UNDERSCORE).replace(SPACE, UNDERSCORE)
-
-
-def parse_entry_bg(item):
-    dark_clrs = "^(Black|(Gray+([1-9]|[1-3][0-9]|[4][0-5])))$"
-    if (re.findall(dark_clrs, item)): 
-        # e.g:  Black, Gray1, Gray2, ..., Gray10, 
-        #       Gray11,  ..., Gray30,..., Gray45                                 
-        return WHITE
-    return BLACK
-
-
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from a string."""
-    return ANSI_PATTERN.sub('', text)
-
-
-def get_color_escape(r=None, g=None, b=None, empty=True) -> str:
-    """
-    Convert RGB format into ANSI colour format.
-
-    Args:
-        r (int | None): Red component (0-255).
-        g (int | None): Green component (0-255).
-        b (int | None): Blue component (0-255).
-        empty (bool): If True, returns an empty string regardless of RGB.
-
-    Returns:
-        str: ANSI escape code for the color, or EMPTY if not applicable.
-    """
-    if empty:
-        return EMPTY
-
-    # If r is actually a tuple/list (unpacking mistake)
-    if isinstance(r, (tuple, list)) and len(r) == 3:
-        r, g, b = r
-
-    # Validate values
-    if not all(isinstance(x, int) and 0 <= x <= 255 for x in (r, g, b)):
-        return EMPTY
-
-    return f"\033[38;2;{r};{g};{b}m"
-
-
-# ───────────────────────────────────────────────
-# Board Serialization and Conversion ♻️
-# ───────────────────────────────────────────────
-
-def board_to_str(mapping: Sequence[Sequence[str]]) -> str:
-    """
-    Flattens a 2D board into a single string.
-
-    Note:
-        Uses UNDERSCORE for empty cells.
-
-    Args:
-        mapping (Sequence[Sequence[str]]): The board to serialize.
-
-    Returns:
-        str: Flattened string version of the board.
-    """
-    return "".join(cell if cell else UNDERSCORE for row in mapping for cell in row)
-
-
-def str_to_board(board_str: str, size: int) -> List[List[str]]:
-    """
-    Converts a flat string back to a 2D board.
-
-    Args:
-        board_str (str): Serialized board string.
-        size (int): Size of one board dimension.
-
-    Returns:
-        List[List[str]]: 2D board.
-
-    Raises:
-        ValueError: If string length does not match expected board size.
-    """
-    expected = size ** 2
-    if len(board_str) != expected:
-        raise ValueError(f"Expected board string of length {expected}, got {len(board_str)}")
-    return [list(board_str[i:i + size]) for i in range(0, expected, size)]
-
-
-# ───────────────────────────────────────────────
-# AI Scoring and Heuristics Utils 🎯
-# ───────────────────────────────────────────────
-
-def calculate_boost_score(
-    combo: Sequence[str],
-    positions: Sequence[Tuple[int, int]],
-    size_board: int,
-    board: Sequence[Sequence[str]]
-) -> float:
-    """
-    Applies heuristic scoring to a combo line based on symbol count,
-    positional context, and symmetry.
-
-    Args:
-        combo (Sequence[str]): Values in the current line (row/col/diagonal).
-        positions (Sequence[Tuple[int, int]]): Positions of the line's cells.
-        size_board (int): Board size.
-        board (Sequence[Sequence[str]]): Game board representation.
-
-    Returns:
-        float: Final score with positional + symmetry + threat/strategy weight.
-    """
-    ai = combo.count(AI_MARK)
-    player = combo.count(PLAYER_MARK)
-    empty = combo.count(UNDERSCORE)
-
-    # Lines with both player and AI are neutral (no value)
-    if ai and player:
-        return 0.0
-
-    # Positional bonus (based on available empty cells)
-    positional_bonus = sum(
-        positional_score_extended(r, c, size_board)
-        for r, c in positions
-        if board[r][c] == UNDERSCORE
-    )
-
-    # Heuristic scoring rules
-    rules = [
-        (ai == size_board - 1 and empty == 1, 100.0),   # AI can win
-        (player == size_board - 1 and empty == 1, 90.0),# Must block opponent
-        (ai == size_board - 2 and empty == 2, 15.0),
-        (player == size_board - 2 and empty == 2, 14.0),
-        (ai == size_board - 3 and empty == 3, 6.0),
-        (player == size_board - 3 and empty == 3, 5.0),
-        (ai == 1 and empty == size_board - 1, 3.0),
-        (player == 1 and empty == size_board - 1, 2.0),
-        (empty == size_board, 1.0),                    # Fully empty line
-        (ai == size_board - 2 and player == 0 and empty == 2, 5.0), # Threat pattern
-        (player > ai and empty > 0, -2.0),              # Penalize losing lines
-    ]
-
-    base_score = sum(value for condition, value in rules if condition)
-    sym_bonus = symmetry_score(positions, size_board)
-
-    return round(base_score + positional_bonus + sym_bonus, 4)
-
-
-def is_winning_combo(combo: Sequence[str]) -> bool:
-    """
-    Returns True if all elements in the combo are equal and not empty.
-
-    Args:
-        combo (Sequence[str]): Line of symbols (e.g., ['X', 'X', 'X']).
-
-    Returns:
-        bool: True if all equal and not empty.
-    """
-    return len(set(combo)) == 1 and combo[0] != UNDERSCORE
-
-
-def score_combo(
-    combo: Sequence[str],
-    positions: Sequence[Tuple[int, int]],
-    boost: bool,
-    size_board: int,
-    board: Sequence[Sequence[str]]
-) -> int:
-    """
-    Scores a line: win, or strategic score if boost is enabled.
-
-    Args:
-        combo (Sequence[str]): Symbols in the line.
-        positions (Sequence[Tuple[int, int]]): Cell coordinates.
-        boost (bool): Whether to apply strategy-based scoring.
-        size_board (int): Board size (e.g., 3 or 4).
-        board (Sequence[Sequence[str]]): Current board state.
-
-    Returns:
-        int: Score from win or strategic evaluation.
-    """
-    if len(set(combo)) == 1 and combo[0] != UNDERSCORE:
-        return 10 if combo[0] == AI_MARK else -10
-
-    return int(calculate_boost_score(combo, positions, size_board, board)) if boost else 0
-
-
-def win_score(combo: Sequence[str]) -> int:
-    """
-    Returns a fixed score depending on who wins.
-
-    Args:
-        combo (Sequence[str]): A winning combo (e.g., all 'X' or all 'O').
-
-    Returns:
-        int: +10 if AI wins, -10 if player wins.
-    """
-    return 10 if combo[0] == AI_MARK else -10
-
-
-# ───────────────────────────────────────────────
-# Widget Name Builder Utils 🏷️
-# ───────────────────────────────────────────────
-
-def build_name(base: str, prefix: Optional[str] = None, suffix: Optional[str] = None) -> str:
-    """
-    Build a widget name using WidgetKey as a helper.
-    Example:
-        build_name("1", prefix="ANIMAL", suffix="LABEL") -> "ANIMAL1LABEL"
-    """
-    return WidgetKey(prefix, base, suffix).build_name()
-
-
-def build_widget_names(prefix: str, base: str, components: list[str]) -> dict[str, str]:
-    """
-    Build a dictionary of widget names using a common prefix and base.
-
-    Args:
-        prefix (str): Prefix for widget names (e.g., ANIMAL, COLOR).
-        base (str): Base identifier (e.g., "1").
-        components (list[str]): Suffixes to build (e.g., [LABEL, LIST, SELECT]).
-
-    Returns:
-        dict[str, str]: Mapping of component -> widget name.
-    """
-    base_name = build_name(base, prefix=prefix)
-    return {
-        'base': base_name,
-        **{comp: build_name(base, prefix=prefix, suffix=comp) for comp in components}
-    }
-
-
-# ───────────────────────────────────────────────
-# Widget Formatting Helpers 🐾
-# ───────────────────────────────────────────────
-
-def format_key(key: str, select: str, animals: dict[str, str]) -> str:
-    """
-    Format key for display. If the selection is an animal, 
-    retrieve the mapped animal name.
-    """
-    if COLOR in select:
-        return key
-    return animals.get(key, key)
-
-
-def get_animal_name(icon: str, animal_icons_to_names: dict[str, str]) -> str:
-    """
-    Retrieve the mapped name of an animal given its icon.
-    """
-    return animal_icons_to_names.get(icon, icon)
-
+#!/usr/bin/env python3
+
+"""
+TicTacToe Helper Methods - Utility Functions for Game Logic and AI Scoring
+
+This module provides reusable utility functions that support various parts of the
+Tic Tac Toe project, including positional evaluation, board transformations,
+symmetry detection, and scoring heuristics for AI levels.
+
+- Generic Utilities (Normalization, Keys, Labels)
+- Board Serialization and Conversion
+- AI Scoring and Heuristics
+- Positional and Symmetry Bonuses
+
+These functions aim to promote code reuse, modularity, and clarity throughout the project.
+
+Compatible with: Windows, macOS, Linux (UTF-8, ANSI colors supported)
+
+Author: Andrés David Aguilar Aguilar  
+Date: 2025-07-16
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple, Sequence
+
+from tic_tac_toe.core.enums import WidgetKey, LabelType
+from tic_tac_toe.core.literals import *
+
+ANSI_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Dark background colors: Black plus Gray1..Gray45 (compiled once; the
+# pattern used to be rebuilt by re.findall on every entry parsed)
+_DARK_COLOR_RE = re.compile(r'^(Black|(Gray+([1-9]|[1-3][0-9]|[4][0-5])))$')
+
+# Username normalization: newline and space both map to underscore in a
+# single C-level translate pass
+_NORMALIZE_TBL = str.maketrans({'\n': UNDERSCORE, SPACE: UNDERSCORE})
+
+# Formatted truecolor escapes, one per distinct (r, g, b) seen
+_ANSI_FG_CACHE: dict = {}
+
+
+# ───────────────────────────────────────────────
+# Positional Evaluation Helpers 📍
+# ───────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def _center_cells(size: int) -> frozenset:
+    """
+    Returns the set of center cells for a board size (one cell for odd
+    sizes, the central 2x2 block for even sizes). Cached per size.
+    """
+    center = size // 2
+    if size % 2 == 1:
+        return frozenset({(center, center)})
+    return frozenset({
+        (center - 1, center - 1), (center - 1, center),
+        (center, center - 1), (center, center)
+    })
+
+
+# Constant-folded 3x3 positional table: each nibble of the packed word
+# indexes _POS_LUT (corner/edge: 0.15/0.06, center: 0.24), sparing the
+# default board size the rule cascade entirely
+_POS_LUT = (0.06, 0.15, 0.24)
+_POS_PACKED_3 = 0x101020101
+
+
+@lru_cache(maxsize=None)
+def _pos_score_table(size: int) -> Tuple[float, ...]:
+    """
+    Precomputes the positional bonus of every cell for a board size.
+
+    The bonus of a cell never changes during play, so the rule cascade is
+    evaluated once per size and lookups become a flat tuple index. The
+    3x3 table is unpacked from a baked-in constant.
+
+    Args:
+        size (int): Board size.
+
+    Returns:
+        Tuple[float, ...]: Bonus per flat cell index (row * size + col).
+    """
+    if size == 3:
+        return tuple(
+            _POS_LUT[(_POS_PACKED_3 >> (4 * idx)) & 0xF] for idx in range(9)
+        )
+
+    center = size // 2
+    center_cells = _center_cells(size)
+    corners = {(0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1)}
+
+    table = []
+    for row in range(size):
+        for col in range(size):
+            score = 0.0
+            bonuses = (
+                (0.15, (row, col) in center_cells),  # Center bonus
+                (0.08, (row, col) in corners),  # Corners
+                (0.05, row == col or row + col == size - 1),  # Diagonals
+                (0.04, row == center or col == center),  # Center row/col
+                (0.02, row in (0, size - 1) or col in (0, size - 1))  # Edges
+            )
+            for bonus, condition in bonuses:
+                if condition:
+                    score += bonus
+            table.append(round(score, 4))
+
+    return tuple(table)
+
+
+def positional_score_extended(row: int, col: int, size: int) -> float:
+    """
+    Returns a positional bonus based on key board areas:
+    center, corners, diagonals, symmetry axes, and edges.
+
+    Thin wrapper over the per-size precomputed table.
+
+    Args:
+        row (int): Row index.
+        col (int): Column index.
+        size (int): Board size.
+
+    Returns:
+        float: Total bonus score based on position.
+    """
+    return _pos_score_table(size)[row * size + col]
+
+
+@lru_cache(maxsize=None)
+def _sym_masks(size: int) -> Tuple[int, int, int, int, int]:
+    """
+    Precomputes the bitmasks of the symmetry regions for a board size:
+    main diagonal, anti-diagonal, center cells, center row, center column.
+
+    Returns:
+        Tuple[int, int, int, int, int]: (main, anti, center, center_row,
+            center_col) masks over flat cell indices.
+    """
+    center = size // 2
+    main = anti = center_mask = center_row = center_col = 0
+    for row in range(size):
+        for col in range(size):
+            bit = 1 << (row * size + col)
+            if row == col:
+                main |= bit
+            if row + col == size - 1:
+                anti |= bit
+            if (row, col) in _center_cells(size):
+                center_mask |= bit
+            if row == center:
+                center_row |= bit
+            if col == center:
+                center_col |= bit
+    return main, anti, center_mask, center_row, center_col
+
+
+def symmetry_score(positions: Sequence[Tuple[int, int]], size: int) -> float:
+    """
+    Computes bonus based on symmetry: diagonal alignment and center involvement.
+
+    Each region is a precomputed bitmask, so the five coordinate scans
+    reduce to subset (AND + compare) and overlap (AND) tests on the
+    line's own mask.
+
+    Args:
+        positions (Sequence[Tuple[int, int]]): Coordinates in a potential combo.
+        size (int): Board size.
+
+    Returns:
+        float: Bonus score for symmetry patterns.
+    """
+    if not positions:
+        return 0.0
+
+    lm = line_mask(tuple(positions), size)
+    main, anti, center_mask, center_row, center_col = _sym_masks(size)
+
+    score = 0.0
+    if (lm & main) == lm:        # Main diagonal
+        score += 1.5
+    if (lm & anti) == lm:        # Anti-diagonal
+        score += 1.5
+    if lm & center_mask:         # Center involvement
+        score += 1.0
+    if lm & center_row:          # Center row
+        score += 0.5
+    if lm & center_col:          # Center column
+        score += 0.5
+
+    return score
+
+
+# ───────────────────────────────────────────────
+# Generic Utility Functions 🧩
+# ───────────────────────────────────────────────
+
+# Zero-padding widths per numeric label type; anything absent pads to 0
+_ZFILL_PADS = {LabelType.SCORE: 3, LabelType.WINS: 2}
+
+
+def get_zfill_pad(label: LabelType) -> int:
+    """
+    Return the zero-padding width for a given label type.
+
+    This is used to format numeric fields (like scores or wins) with leading zeros
+    in the ranking display or UI elements.
+
+    Args:
+        label (LabelType): The label type ('score', 'wins', etc.).
+
+    Returns:
+        int: Number of digits to pad with zeros (e.g., 3 → '007', 2 → '05').
+             Defaults to 0 for unsupported or non-numeric label types.
+    """
+    return _ZFILL_PADS.get(label, 0)
+        
+
+@lru_cache(maxsize=1024)
+def _cached_lower(text: str) -> str:
+    """
+    Lowercases a string through a small cache: key building cycles over
+    the same few labels and usernames, so each distinct string is lowered
+    at most once per session.
+    """
+    return text.lower()
+
+
+@lru_cache(maxsize=512)
+def make_key(label: str, normalized_username: str, extra_label: Optional[str] = None) -> WidgetKey:
+    """
+    Create a unique key tuple for dictionary lookups to avoid string concatenation.
+
+    Cached: the argument domain is a handful of labels times the session's
+    users, so repeated calls resolve to a dict hit instead of new lowering
+    and tuple construction.
+
+    Args:
+        label (str): Label type string (e.g., 'score', 'wins').
+        normalized_username (str): Normalized username string.
+        extra_label (Optional[str]): Optional extra label for further key distinction.
+
+    Returns:
+        WidgetKey: Frozen key for dict storage.
+    """
+    return WidgetKey(
+        _cached_lower(label),
+        _cached_lower(normalized_username),
+        _cached_lower(extra_label) if extra_label else None
+    )
+
+
+@lru_cache(maxsize=512)
+def normalize_user(user: str) -> str:
+    """
+    Normalize a username by removing newlines and replacing spaces with underscores.
+
+    Cached: the same few usernames are normalized on every load and save.
+
+    Args:
+        user (str): The username string to normalize.
+
+    Returns:
+        str: The normalized username.
+    """
+    return user.translate(_NORMALIZE_TBL)
+
+
+def parse_entry_bg(item):
+    if _DARK_COLOR_RE.match(item):
+        # e.g:  Black, Gray1, Gray2, ..., Gray10, 
+        #       Gray11,  ..., Gray30,..., Gray45                                 
+        return WHITE
+    return BLACK
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape codes from a string."""
+    if '\x1b' not in text:
+        return text
+    return ANSI_PATTERN.sub('', text)
+
+
+def get_color_escape(r=None, g=None, b=None, empty=True) -> str:
+    """
+    Convert RGB format into ANSI colour format.
+
+    Args:
+        r (int | None): Red component (0-255).
+        g (int | None): Green component (0-255).
+        b (int | None): Blue component (0-255).
+        empty (bool): If True, returns an empty string regardless of RGB.
+
+    Returns:
+        str: ANSI escape code for the color, or EMPTY if not applicable.
+    """
+    if empty:
+        return EMPTY
+
+    # If r is actually a tuple/list (unpacking mistake)
+    if isinstance(r, (tuple, list)) and len(r) == 3:
+        r, g, b = r
+
+    escape = _ANSI_FG_CACHE.get((r, g, b))
+    if escape is None:
+        # Validate values
+        if not all(isinstance(x, int) and 0 <= x <= 255 for x in (r, g, b)):
+            return EMPTY
+        escape = _ANSI_FG_CACHE.setdefault((r, g, b), f"\033[38;2;{r};{g};{b}m")
+    return escape
+
+
+# ───────────────────────────────────────────────
+# Board Serialization and Conversion ♻️
+# ───────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def line_mask(positions: Tuple[Tuple[int, int], ...], size: int) -> int:
+    """
+    Returns the bitmask of a line, one bit per flat cell index.
+
+    Cached per (line, size): there are only a handful of winning lines
+    per board layout, so every call after the first is a dict hit.
+
+    Args:
+        positions (Tuple[Tuple[int, int], ...]): Coordinates of the line.
+        size (int): Board size.
+
+    Returns:
+        int: Mask with the line's cell bits set.
+    """
+    mask = 0
+    for r, c in positions:
+        mask |= 1 << (r * size + c)
+    return mask
+
+
+def board_to_masks(board: Sequence[Sequence[str]], size: int) -> Tuple[int, int]:
+    """
+    Packs a symbol board into one occupancy bitmask per side.
+
+    With the masks in hand, per-line counts collapse to an AND plus a
+    popcount and win checks to a single mask equality, instead of
+    Python-level iteration over the line's symbols.
+
+    Args:
+        board (Sequence[Sequence[str]]): The board with symbol cells.
+        size (int): Board size.
+
+    Returns:
+        Tuple[int, int]: (ai_mask, player_mask) occupancy bitmasks.
+    """
+    ai_mask = 0
+    player_mask = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == AI_MARK:
+                ai_mask |= bit
+            elif cell == PLAYER_MARK:
+                player_mask |= bit
+            bit <<= 1
+    return ai_mask, player_mask
+
+
+def board_to_str(mapping: Sequence[Sequence[str]]) -> str:
+    """
+    Flattens a 2D board into a single string.
+
+    Note:
+        Uses UNDERSCORE for empty cells.
+
+        This is a serialization format, not a cache key: position caches
+        (e.g. the AI transposition table) key on incrementally maintained
+        Zobrist hashes instead of rebuilding strings per position.
+
+    Args:
+        mapping (Sequence[Sequence[str]]): The board to serialize.
+
+    Returns:
+        str: Flattened string version of the board.
+    """
+    # Fast path: with single-character cells the whole board collapses in
+    # one C-level join pass per row; only boards holding EMPTY strings
+    # (which would shrink the result) take the cell-by-cell fallback.
+    size = len(mapping)
+    flat = "".join(map("".join, mapping))
+    if len(flat) == size * size:
+        return flat
+    return "".join([cell if cell else UNDERSCORE for row in mapping for cell in row])
+
+
+def str_to_board(board_str: str, size: int) -> List[List[str]]:
+    """
+    Converts a flat string back to a 2D board.
+
+    Args:
+        board_str (str): Serialized board string.
+        size (int): Size of one board dimension.
+
+    Returns:
+        List[List[str]]: 2D board.
+
+    Raises:
+        ValueError: If string length does not match expected board size.
+    """
+    expected = size ** 2
+    if len(board_str) != expected:
+        raise ValueError(f"Expected board string of length {expected}, got {len(board_str)}")
+    return [list(board_str[row]) for row in _row_slices(size)]
+
+
+@lru_cache(maxsize=None)
+def _row_slices(size: int) -> Tuple[slice, ...]:
+    """
+    Returns the per-row slice objects of a flattened board, cached per
+    size so deserialization skips rebuilding the index arithmetic.
+    """
+    return tuple(slice(i, i + size) for i in range(0, size * size, size))
+
+
+# ───────────────────────────────────────────────
+# AI Scoring and Heuristics Utils 🎯
+# ───────────────────────────────────────────────
+
+def calculate_boost_score(
+    positions: Sequence[Tuple[int, int]],
+    size_board: int,
+    board: Sequence[Sequence[str]],
+    masks: Optional[Tuple[int, int]] = None
+) -> float:
+    """
+    Applies heuristic scoring to a combo line based on symbol count,
+    positional context, and symmetry.
+
+    The line occupancy is read from the side bitmasks: counting marks is
+    an AND plus a popcount per side instead of three scans of the line.
+
+    Args:
+        positions (Sequence[Tuple[int, int]]): Positions of the line's cells.
+        size_board (int): Board size.
+        board (Sequence[Sequence[str]]): Game board representation.
+        masks (Tuple[int, int] | None): Precomputed (ai_mask, player_mask)
+            occupancy; pass when scoring several lines of one board so the
+            board is only packed once.
+
+    Returns:
+        float: Final score with positional + symmetry + threat/strategy weight.
+    """
+    if masks is None:
+        masks = board_to_masks(board, size_board)
+    ai_mask, player_mask = masks
+    positions = tuple(positions)
+    lm = line_mask(positions, size_board)
+    return _score_line(
+        positions, ai_mask & lm, player_mask & lm, size_board
+    )
+
+
+@lru_cache(maxsize=4096)
+def _score_line(
+    positions: Tuple[Tuple[int, int], ...],
+    ai_bits: int,
+    player_bits: int,
+    size_board: int
+) -> float:
+    """
+    Scores one line from its in-line occupancy bits.
+
+    Cached: a line has at most 3**len states, so mid-game scoring quickly
+    turns into pure dict hits keyed by (line, ai_bits, player_bits).
+
+    Args:
+        positions (Tuple[Tuple[int, int], ...]): The line's coordinates.
+        ai_bits (int): AI occupancy restricted to the line's mask.
+        player_bits (int): Player occupancy restricted to the line's mask.
+        size_board (int): Board size.
+
+    Returns:
+        float: Heuristic value of the line.
+    """
+    ai = ai_bits.bit_count()
+    player = player_bits.bit_count()
+
+    # Lines with both player and AI are neutral (no value)
+    if ai and player:
+        return 0.0
+
+    empty = size_board - ai - player
+
+    # The positional bonus depends only on which cells are empty, so the
+    # occupancy split of the rest of the line shares one LUT entry
+    empty_mask = line_mask(positions, size_board) & ~(ai_bits | player_bits)
+    positional_bonus = (
+        _empty_pos_bonus(empty_mask, size_board) if empty_mask else 0.0
+    )
+
+    # Heuristic scoring rules
+    rules = [
+        (ai == size_board - 1 and empty == 1, 100.0),   # AI can win
+        (player == size_board - 1 and empty == 1, 90.0),# Must block opponent
+        (ai == size_board - 2 and empty == 2, 15.0),
+        (player == size_board - 2 and empty == 2, 14.0),
+        (ai == size_board - 3 and empty == 3, 6.0),
+        (player == size_board - 3 and empty == 3, 5.0),
+        (ai == 1 and empty == size_board - 1, 3.0),
+        (player == 1 and empty == size_board - 1, 2.0),
+        (empty == size_board, 1.0),                    # Fully empty line
+        (ai == size_board - 2 and player == 0 and empty == 2, 5.0), # Threat pattern
+        (player > ai and empty > 0, -2.0),              # Penalize losing lines
+    ]
+
+    base_score = sum(value for condition, value in rules if condition)
+    sym_bonus = symmetry_score(positions, size_board)
+
+    return round(base_score + positional_bonus + sym_bonus, 4)
+
+
+@lru_cache(maxsize=2048)
+def _empty_pos_bonus(empty_mask: int, size: int) -> float:
+    """
+    Sums the positional bonuses of the cells set in ``empty_mask``.
+
+    Cached on the mask itself: a line has only 2**len empty-cell subsets
+    versus 3**len occupancy states, so different ai/player splits of the
+    same line reuse one entry.
+    """
+    pos_table = _pos_score_table(size)
+    bonus = 0.0
+    while empty_mask:
+        low = empty_mask & -empty_mask
+        bonus += pos_table[low.bit_length() - 1]
+        empty_mask ^= low
+    return bonus
+
+
+def is_winning_combo(combo: Sequence[str]) -> bool:
+    """
+    Returns True if all elements in the combo are equal and not empty.
+
+    Args:
+        combo (Sequence[str]): Line of symbols (e.g., ['X', 'X', 'X']).
+
+    Returns:
+        bool: True if all equal and not empty.
+    """
+    first = combo[0]
+    if first == UNDERSCORE:
+        return False
+    for value in combo:
+        if value != first:
+            return False
+    return True
+
+
+def score_combo(
+    combo: Sequence[str],
+    positions: Sequence[Tuple[int, int]],
+    boost: bool,
+    size_board: int,
+    board: Sequence[Sequence[str]],
+    masks: Optional[Tuple[int, int]] = None
+) -> int:
+    """
+    Scores a line: win, or strategic score if boost is enabled.
+
+    Args:
+        combo (Sequence[str]): Symbols in the line.
+        positions (Sequence[Tuple[int, int]]): Cell coordinates.
+        boost (bool): Whether to apply strategy-based scoring.
+        size_board (int): Board size (e.g., 3 or 4).
+        board (Sequence[Sequence[str]]): Current board state.
+        masks (Tuple[int, int] | None): Precomputed board occupancy masks,
+            forwarded to calculate_boost_score.
+
+    Returns:
+        int: Score from win or strategic evaluation.
+    """
+    first = combo[0]
+    if first != UNDERSCORE and all(value == first for value in combo):
+        return 10 if first == AI_MARK else -10
+
+    return int(calculate_boost_score(positions, size_board, board, masks)) if boost else 0
+
+
+def win_score(combo: Sequence[str]) -> int:
+    """
+    Returns a fixed score depending on who wins.
+
+    Args:
+        combo (Sequence[str]): A winning combo (e.g., all 'X' or all 'O').
+
+    Returns:
+        int: +10 if AI wins, -10 if player wins.
+    """
+    return 10 if combo[0] == AI_MARK else -10
+
+
+def win_score_mask(ai_mask: int, player_mask: int, lm: int) -> int:
+    """
+    Folds the win check and its value into one mask expression.
+
+    Args:
+        ai_mask (int): AI occupancy bitmask (see board_to_masks).
+        player_mask (int): Player occupancy bitmask.
+        lm (int): Bitmask of the line to test (see line_mask).
+
+    Returns:
+        int: +10 if the AI owns the whole line, -10 if the player does,
+            0 otherwise.
+    """
+    return 10 if (ai_mask & lm) == lm else -10 if (player_mask & lm) == lm else 0
+
+
+# ───────────────────────────────────────────────
+# Widget Name Builder Utils 🏷️
+# ───────────────────────────────────────────────
+
+@lru_cache(maxsize=512)
+def build_name(base: str, prefix: Optional[str] = None, suffix: Optional[str] = None) -> str:
+    """
+    Build a widget name using WidgetKey as a helper.
+    Example:
+        build_name("1", prefix="ANIMAL", suffix="LABEL") -> "ANIMAL1LABEL"
+
+    Cached: widget names are rebuilt for the same (prefix, base, suffix)
+    triples on every redraw, so repeats skip the WidgetKey round-trip.
+    """
+    return WidgetKey(prefix, base, suffix).build_name()
+
+
+def build_widget_names(prefix: str, base: str, components: list[str]) -> dict[str, str]:
+    """
+    Build a dictionary of widget names using a common prefix and base.
+
+    Args:
+        prefix (str): Prefix for widget names (e.g., ANIMAL, COLOR).
+        base (str): Base identifier (e.g., "1").
+        components (list[str]): Suffixes to build (e.g., [LABEL, LIST, SELECT]).
+
+    Returns:
+        dict[str, str]: Mapping of component -> widget name.
+    """
+    base_name = build_name(base, prefix=prefix)
+    return {
+        'base': base_name,
+        **{comp: build_name(base, prefix=prefix, suffix=comp) for comp in components}
+    }
+
+
+# ───────────────────────────────────────────────
+# Widget Formatting Helpers 🐾
+# ───────────────────────────────────────────────
+
+def format_key(key: str, select: str, animals: dict[str, str]) -> str:
+    """
+    Format key for display. If the selection is an animal, 
+    retrieve the mapped animal name.
+    """
+    if COLOR in select:
+        return key
+    return animals.get(key, key)
+
+
+def get_animal_name(icon: str, animal_icons_to_names: dict[str, str]) -> str:
+    """
+    Retrieve the mapped name of an animal given its icon.
+    """
+    return animal_icons_to_names.get(icon, icon)
+
@@ -1,19 +1,30 @@
-# tests/conftest.py
-
-import pytest
-from unittest.mock import MagicMock, patch
-
-def fake_tk_init(self, *args, **kwargs):
-    self.tk = MagicMock()  # evita dependencias reales
-    self._w = "mock"       # Tkinter usa esto como identificador
-    self.children = {}
-
-@pytest.fixture(autouse=True)
-def patch_tkinter():
-    with patch("tkinter.Tk.__init__", new=fake_tk_init), \
-         patch("tkinter.Tk.mainloop", return_value=None), \
-         patch("tkinter.IntVar", new=MagicMock), \
-         patch("tkinter.StringVar", new=MagicMock), \
-         patch("tkinter.BooleanVar", new=MagicMock):
-        yield
-
+# tests/conftest.py
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+def fake_tk_init(self, *args, **kwargs):
+    self.tk = MagicMock()  # evita dependencias reales
+    self._w = "mock"       # Tkinter usa esto como identificador
+    self.children = {}
+
+@pytest.fixture(autouse=True)
+def patch_tkinter():
+    with patch("tkinter.Tk.__init__", new=fake_tk_init), \
+         patch("tkinter.Tk.mainloop", return_value=None), \
+         patch("tkinter.IntVar", new=MagicMock), \
+         patch("tkinter.StringVar", new=MagicMock), \
+         patch("tkinter.BooleanVar", new=MagicMock):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_log_dir(tmp_path, monkeypatch):
+    """Redirect game logs to a per-test temporary directory.
+
+    The GUI fixtures build real TicTacToeGame -> LogGame instances, so
+    without this every run appends mock reprs to the repository's
+    data/logs directory.
+    """
+    monkeypatch.setattr("tic_tac_toe.core.log_game.ROOT_PATH_LOGS", tmp_path)
+
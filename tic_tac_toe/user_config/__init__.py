@@ -1,6 +1,6 @@
-# tic_tac_toe/user_config/__init__.py
-
-from tic_tac_toe.user_config.user_credentials_storage import *
-from tic_tac_toe.user_config.user_credentials_validator import *
-from tic_tac_toe.user_config.user_credentials_callbacks import *
-from tic_tac_toe.user_config.user_credentials_gui import *
+# tic_tac_toe/user_config/__init__.py
+
+from tic_tac_toe.user_config.user_credentials_storage import *
+from tic_tac_toe.user_config.user_credentials_validator import *
+from tic_tac_toe.user_config.user_credentials_callbacks import *
+from tic_tac_toe.user_config.user_credentials_gui import *